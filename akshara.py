@@ -0,0 +1,31 @@
+# akshara.py
+# Akshara (orthographic syllable) boundaries for Kannada words.
+# A boundary is any code-point offset that does not fall in front of a
+# combining mark (vowel sign, virama, anusvara, visarga, nukta, length mark,
+# ZWJ/ZWNJ). Offsets right after a virama are kept: that is where a
+# consonant-final word meets the next one (ಡಾರ್ಕ್ + ವೆಬ್ -> ಡಾರ್ಕ್ವೆಬ್).
+
+import unicodedata
+from typing import List
+
+# every Kannada-block mark (Mn/Mc) plus the joiners used inside conjuncts
+COMBINING_MARKS = frozenset(
+    [chr(c) for c in range(0x0C80, 0x0D00) if unicodedata.category(chr(c)) in ("Mn", "Mc")]
+    + ["\u200c", "\u200d"]
+)
+
+
+def akshara_offsets(word: str) -> List[int]:
+    """Boundary offsets of `word`, including 0 and len(word)."""
+    offs = [0] if word else []
+    for i in range(1, len(word)):
+        if word[i] not in COMBINING_MARKS:
+            offs.append(i)
+    if word:
+        offs.append(len(word))
+    return offs
+
+
+def split_points(word: str) -> List[int]:
+    """Interior boundaries only: the offsets where `word` may be cut in two."""
+    return akshara_offsets(word)[1:-1]
@@ -0,0 +1,303 @@
+# analysis_server.py
+# Local HTTP analysis service: one warm WordJoiner behind a small asyncio server.
+# Concurrent requests to the same endpoint are coalesced into micro-batches
+# (collected for --window-ms or until --max-batch) and run on a thread pool
+# through the WordJoiner batch APIs. Binds to 127.0.0.1 only.
+#
+#   python analysis_server.py --port 8765
+#   curl 'http://127.0.0.1:8765/sandhi?word1=ಶಕ್ತಿ&word2=ಅಭಿಮಾನ'
+#   curl -d '{"word": "ಶಕ್ತ್ಯಭಿಮಾನ"}' http://127.0.0.1:8765/reverse
+#   curl http://127.0.0.1:8765/stats
+#   curl -X POST http://127.0.0.1:8765/stats/reset
+#
+# Endpoints: /sandhi (word1, word2), /reverse (word), /samasa (word),
+# /vibhakti (word, optional ending), /stats. GET query or POST JSON body.
+# With --stage-stats, /stats also reports per-stage counters for the
+# validate_compound cascade and apply_sandhi; /stats/reset clears them.
+
+import argparse, asyncio, json, time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set
+from urllib.parse import urlsplit, parse_qsl
+
+from code.word_joiner import WordJoiner
+
+HOST = "127.0.0.1"
+
+
+def _percentile(sorted_vals: List[float], q: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    k = min(len(sorted_vals) - 1, max(0, int(round(q / 100.0 * (len(sorted_vals) - 1)))))
+    return sorted_vals[k]
+
+
+class EndpointStats:
+    """Request count, batch sizes and a bounded window of recent latencies."""
+    def __init__(self, window: int = 10000):
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_items = 0
+        self.latencies_ms = deque(maxlen=window)
+
+    def snapshot(self) -> Dict[str, Any]:
+        lat = sorted(self.latencies_ms)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "batches": self.batches,
+            "mean_batch_size": round(self.batched_items / self.batches, 2) if self.batches else 0.0,
+            "latency_ms": {
+                "p50": round(_percentile(lat, 50), 3),
+                "p95": round(_percentile(lat, 95), 3),
+                "p99": round(_percentile(lat, 99), 3),
+                "max": round(lat[-1], 3) if lat else 0.0,
+            },
+        }
+
+
+class MicroBatcher:
+    """
+    Collect items submitted within `window` seconds (or until max_batch),
+    then run `batch_fn(items) -> results` once on the executor.
+    """
+    def __init__(self, batch_fn: Callable[[list], list], executor, stats: EndpointStats,
+                 window: float = 0.002, max_batch: int = 256):
+        self.batch_fn = batch_fn
+        self.executor = executor
+        self.stats = stats
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()   # running dispatches (the loop keeps only weak refs)
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def submit(self, item):
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, fut))
+        return await fut
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # dispatch without waiting so several batches can use the pool at once
+            task = loop.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._dispatch_done)
+
+    def _dispatch_done(self, task: asyncio.Task):
+        self._inflight.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            # _dispatch fails its futures itself; anything reaching here is a bug
+            asyncio.get_running_loop().call_exception_handler({
+                "message": "micro-batch dispatch failed", "exception": task.exception(), "task": task})
+
+    async def _dispatch(self, batch):
+        loop = asyncio.get_running_loop()
+        items = [item for item, _ in batch]
+        self.stats.batches += 1
+        self.stats.batched_items += len(items)
+        try:
+            results = await loop.run_in_executor(self.executor, self.batch_fn, items)
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        for (_, fut), res in zip(batch, results):
+            if not fut.done():
+                fut.set_result(res)
+
+
+def _batch_functions(wj: WordJoiner) -> Dict[str, Callable[[list], list]]:
+    def sandhi(items):
+        pairs = [(p.get("word1", ""), p.get("word2", "")) for p in items]
+        return [{"word1": a, "word2": b, "result": r}
+                for (a, b), r in zip(pairs, wj.apply_sandhi_many(pairs))]
+
+    def reverse(items):
+        return [{"word": p.get("word", ""),
+                 "candidates": [list(c) for c in wj.reverse_sandhi(p.get("word", ""))]}
+                for p in items]
+
+    def samasa(items):
+        words = [p.get("word", "") for p in items]
+        return [{"word": w, "split": list(sp) if sp else None}
+                for w, sp in zip(words, wj.validate_compound_many(words))]
+
+    def vibhakti(items):
+        out = []
+        for p in items:
+            w, e = p.get("word", ""), p.get("ending", "")
+            form, vid = wj.apply_vibhakti(w, e) if e else wj.apply_vibhakti_single(w)
+            det_id, suf = wj.detect_vibhakti(form)
+            out.append({"word": w, "ending": e or None, "output": form,
+                        "vibhakti_id": vid or det_id, "suffix": suf})
+        return out
+
+    return {"sandhi": sandhi, "reverse": reverse, "samasa": samasa, "vibhakti": vibhakti}
+
+
+class AnalysisServer:
+    def __init__(self, wj: Optional[WordJoiner] = None, workers: int = 2,
+                 window_ms: float = 2.0, max_batch: int = 256, stage_stats: bool = False):
+        self.wj = (wj or WordJoiner()).preload()
+        if stage_stats:
+            self.wj.enable_stage_stats()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.window = window_ms / 1000.0
+        self.max_batch = max_batch
+        self.stats: Dict[str, EndpointStats] = {}
+        self.batchers: Dict[str, MicroBatcher] = {}
+        self.started = time.time()
+
+    def _start_batchers(self):
+        for name, fn in _batch_functions(self.wj).items():
+            st = self.stats[name] = EndpointStats()
+            b = self.batchers[name] = MicroBatcher(fn, self.executor, st, self.window, self.max_batch)
+            b.start()
+
+    def stats_snapshot(self) -> Dict[str, Any]:
+        return {
+            "uptime_s": round(time.time() - self.started, 1),
+            "endpoints": {name: st.snapshot() for name, st in self.stats.items()},
+            "cache": self.wj.cache_stats(),
+            "stages": self.wj.stage_stats(),
+        }
+
+    async def handle(self, method: str, target: str, body: bytes):
+        """Return (status, payload) for one request."""
+        url = urlsplit(target)
+        name = url.path.strip("/")
+        if name == "stats":
+            return 200, self.stats_snapshot()
+        if name == "stats/reset":
+            if method != "POST":
+                return 405, {"error": "/stats/reset requires POST", "allow": "POST"}
+            self.wj.reset_stage_stats()
+            return 200, {"reset": True}
+        batcher = self.batchers.get(name)
+        if batcher is None:
+            return 404, {"error": f"unknown endpoint /{name}"}
+        params = dict(parse_qsl(url.query))
+        if method == "POST" and body:
+            try:
+                data = json.loads(body.decode("utf-8"))
+            except ValueError:
+                return 400, {"error": "body must be a JSON object"}
+            if not isinstance(data, dict):
+                return 400, {"error": "body must be a JSON object"}
+            params.update({k: str(v) for k, v in data.items()})
+        st = self.stats[name]
+        st.requests += 1
+        t0 = time.perf_counter()
+        try:
+            result = await batcher.submit(params)
+        except Exception as e:
+            st.errors += 1
+            return 500, {"error": str(e)}
+        st.latencies_ms.append((time.perf_counter() - t0) * 1000.0)
+        return 200, result
+
+    @staticmethod
+    def _respond(writer: asyncio.StreamWriter, status: int, payload: Any, close: bool):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        allow = f"Allow: {payload['allow']}\r\n" if status == 405 else ""
+        writer.write(
+            f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n{allow}"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n".encode("latin-1") + data
+        )
+
+    async def _client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    method, target, _ = line.decode("latin-1").split(" ", 2)
+                except ValueError:
+                    break
+                # curl and browsers may send the query as raw UTF-8 rather than %-escaped
+                try:
+                    target = target.encode("latin-1").decode("utf-8")
+                except UnicodeDecodeError:
+                    target = None
+                headers = {}
+                while True:
+                    h = await reader.readline()
+                    if h in (b"\r\n", b"\n", b""):
+                        break
+                    k, _, v = h.decode("latin-1").partition(":")
+                    headers[k.strip().lower()] = v.strip()
+                try:
+                    length = int(headers.get("content-length") or 0)
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    # the body cannot be framed, so answer and drop the connection
+                    self._respond(writer, 400, {"error": "invalid Content-Length"}, close=True)
+                    await writer.drain()
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                if target is None:
+                    status, payload = 400, {"error": "request target is not valid UTF-8"}
+                else:
+                    status, payload = await self.handle(method.upper(), target, body)
+                close = headers.get("connection", "").lower() == "close"
+                self._respond(writer, status, payload, close)
+                await writer.drain()
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, port: int = 8765, ready: Optional[asyncio.Event] = None):
+        self._start_batchers()
+        server = await asyncio.start_server(self._client, HOST, port)
+        self.port = server.sockets[0].getsockname()[1]
+        if ready is not None:
+            ready.set()
+        async with server:
+            await server.serve_forever()
+
+
+def main(port=8765, workers=2, window_ms=2.0, max_batch=256, stage_stats=False):
+    srv = AnalysisServer(workers=workers, window_ms=window_ms, max_batch=max_batch, stage_stats=stage_stats)
+    print(f"Serving on http://{HOST}:{port}  (endpoints: /sandhi /reverse /samasa /vibhakti /stats)")
+    try:
+        asyncio.run(srv.serve(port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=2, help="engine thread pool size")
+    parser.add_argument("--window-ms", type=float, default=2.0, help="micro-batch collection window")
+    parser.add_argument("--max-batch", type=int, default=256)
+    parser.add_argument("--stage-stats", action="store_true",
+                        help="record per-stage counters for validate_compound / apply_sandhi")
+    args = parser.parse_args()
+    main(args.port, args.workers, args.window_ms, args.max_batch, args.stage_stats)
@@ -0,0 +1,286 @@
+# benchmark.py
+# Throughput and latency benchmark for every WordJoiner operation.
+# Each operation runs against dictionaries scaled to 1x/10x/100x of the shipped
+# root_words.csv / compound_words.csv (extra entries are synthesized from real
+# ones: root+root concatenations and sandhi-joined root pairs). Inputs are
+# seeded samples drawn from those scaled dictionaries. Method caches are off
+# by default, so every call does the full work.
+#
+# Each scale runs in a fresh process and reports its peak RSS; every operation
+# stops after --budget seconds (the calls actually made are recorded).
+#
+# Every run appends one JSON line to --out (default benchmark_results.jsonl),
+# so runs can be compared over time:
+#
+#   python benchmark.py --scales 1 10 100 --samples 2000
+#   python benchmark.py --ops reverse_sandhi validate_compound --scales 1
+
+import argparse, csv, gc, json, os, platform, random, shutil, subprocess, sys, tempfile, time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource   # Unix only; peak RSS is reported as null elsewhere
+except ImportError:
+    resource = None
+
+from code.word_joiner import WordJoiner, DEFAULT_CACHE_SIZES
+from code.analysis_server import _percentile
+
+OPERATIONS = ["construct", "apply_sandhi", "reverse_sandhi", "validate_compound",
+              "apply_vibhakti_single", "detect_vibhakti", "get_suggestions", "transliterate"]
+
+NO_CACHE = {name: 0 for name in DEFAULT_CACHE_SIZES}
+
+# rough Kannada -> Latin table, only used to derive transliterate() inputs from roots
+_ROMAN = {
+    "ಅ": "a", "ಆ": "aa", "ಇ": "i", "ಈ": "ii", "ಉ": "u", "ಊ": "oo", "ಎ": "e", "ಏ": "ee",
+    "ಐ": "ai", "ಒ": "o", "ಓ": "oo", "ಔ": "au",
+    "ಾ": "aa", "ಿ": "i", "ೀ": "ii", "ು": "u", "ೂ": "oo", "ೆ": "e", "ೇ": "ee",
+    "ೈ": "ai", "ೊ": "o", "ೋ": "oo", "ೌ": "au", "ಂ": "m", "ಃ": "h", "್": "",
+    "ಕ": "k", "ಖ": "kh", "ಗ": "g", "ಘ": "gh", "ಚ": "ch", "ಛ": "ch", "ಜ": "j", "ಝ": "j",
+    "ಟ": "t", "ಠ": "th", "ಡ": "d", "ಢ": "dh", "ಣ": "n", "ತ": "t", "ಥ": "th", "ದ": "d",
+    "ಧ": "dh", "ನ": "n", "ಪ": "p", "ಫ": "ph", "ಬ": "b", "ಭ": "bh", "ಮ": "m", "ಯ": "y",
+    "ರ": "r", "ಲ": "l", "ವ": "v", "ಶ": "sh", "ಷ": "sh", "ಸ": "s", "ಹ": "h", "ಳ": "l",
+}
+
+
+def _romanize(word: str) -> str:
+    return "".join(_ROMAN.get(ch, "") for ch in word) or "a"
+
+
+def _summary(latencies_s: List[float]) -> Dict[str, float]:
+    lat = sorted(x * 1e6 for x in latencies_s)
+    total = sum(latencies_s)
+    return {
+        "calls": len(lat),
+        "total_s": round(total, 6),
+        "ops_per_s": round(len(lat) / total, 1) if total else 0.0,
+        "latency_us": {
+            "mean": round(sum(lat) / len(lat), 2) if lat else 0.0,
+            "p50": round(_percentile(lat, 50), 2),
+            "p95": round(_percentile(lat, 95), 2),
+            "p99": round(_percentile(lat, 99), 2),
+            "max": round(lat[-1], 2) if lat else 0.0,
+        },
+    }
+
+
+# ---------- scaled dictionaries ----------
+def _read_rows(path: str) -> Tuple[List[str], List[Dict[str, str]]]:
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        return list(reader.fieldnames or []), list(reader)
+
+
+def _write_rows(path: str, fields: List[str], rows: List[Dict[str, str]]):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def build_scaled_dictionaries(base: WordJoiner, factor: int, out_dir: str, seed: int = 0) -> Dict[str, str]:
+    """
+    Write root/compound CSVs with `factor` times the shipped entries into out_dir
+    (sandhi/vibhakti rules are copied as-is). Returns WordJoiner keyword paths.
+    """
+    rng = random.Random(seed)
+    root_fields, roots = _read_rows(base.root_csv)
+    comp_fields, comps = _read_rows(base.compound_csv)
+    words = [r["word"] for r in roots if r.get("word")]
+
+    seen = set(words)
+    extra_roots = []
+    while len(roots) + len(extra_roots) < len(roots) * factor:
+        w = rng.choice(words) + rng.choice(words)
+        if w not in seen:
+            seen.add(w)
+            extra_roots.append({"word": w, "last_sound": w[-1], "can_combine": "yes"})
+
+    seen = {r.get("combined", "") for r in comps}
+    extra_comps = []
+    while len(comps) + len(extra_comps) < len(comps) * factor:
+        need = len(comps) * factor - len(comps) - len(extra_comps)
+        pairs = [(rng.choice(words), rng.choice(words)) for _ in range(need)]
+        for (a, b), combined in zip(pairs, base.apply_sandhi_many(pairs)):
+            if combined and combined not in seen:
+                seen.add(combined)
+                extra_comps.append({"word1": a, "word2": b, "combined": combined, "frequency": "low"})
+
+    paths = {
+        "root_csv": os.path.join(out_dir, "root_words.csv"),
+        "compound_csv": os.path.join(out_dir, "compound_words.csv"),
+        "sandhi_csv": os.path.join(out_dir, "sandhi_rules.csv"),
+        "vibhakti_csv": os.path.join(out_dir, "vibhakti_rules.csv"),
+    }
+    _write_rows(paths["root_csv"], root_fields, roots + extra_roots)
+    _write_rows(paths["compound_csv"], comp_fields, comps + extra_comps)
+    shutil.copyfile(base.sandhi_csv, paths["sandhi_csv"])
+    shutil.copyfile(base.vibhakti_csv, paths["vibhakti_csv"])
+    return paths
+
+
+# ---------- inputs and timing ----------
+def build_inputs(wj: WordJoiner, samples: int, seed: int = 0) -> Dict[str, List[tuple]]:
+    """Seeded argument tuples per operation, drawn from wj's (scaled) dictionaries."""
+    rng = random.Random(seed)
+    roots = wj._root_list
+    comps = wj._compound_list
+    pick = lambda pool: [rng.choice(pool) for _ in range(samples)]
+    inflected = [wj.apply_vibhakti_single(w)[0] for w in pick(roots)]
+    return {
+        "apply_sandhi": list(zip(pick(roots), pick(roots))),
+        "reverse_sandhi": [(w,) for w in pick(comps)],
+        "validate_compound": [(w,) for w in pick(comps)],
+        "apply_vibhakti_single": [(w,) for w in pick(roots)],
+        "detect_vibhakti": [(w,) for w in inflected],
+        # drop the last code point so the lookup is a near-miss, as typed by a user
+        "get_suggestions": [(w[:-1] or w,) for w in pick(roots)],
+        "transliterate": [(_romanize(w),) for w in pick(roots)],
+    }
+
+
+def time_calls(fn: Callable, args_list: List[tuple], budget: Optional[float] = None) -> List[float]:
+    """Per-call latencies; stops early once `budget` seconds have been spent."""
+    clock = time.perf_counter
+    out = []
+    spent = 0.0
+    for args in args_list:
+        t0 = clock()
+        fn(*args)
+        dt = clock() - t0
+        out.append(dt)
+        spent += dt
+        if budget is not None and spent >= budget:
+            break
+    return out
+
+
+def time_construction(paths: Dict[str, str], repeats: int) -> Dict[str, dict]:
+    """Cold build from CSVs, snapshot write, and warm start from the snapshot."""
+    snap = os.path.join(os.path.dirname(paths["root_csv"]), "word_joiner.snapshot")
+    cold, warm = [], []
+    for _ in range(repeats):
+        gc.collect()
+        t0 = time.perf_counter()
+        WordJoiner(snapshot_path=None, **paths).preload()
+        cold.append(time.perf_counter() - t0)
+    gc.collect()
+    WordJoiner(snapshot_path=None, **paths).save_snapshot(snap)
+    for _ in range(repeats):
+        gc.collect()
+        t0 = time.perf_counter()
+        WordJoiner(snapshot_path=snap, **paths).preload()
+        warm.append(time.perf_counter() - t0)
+    return {"construct_cold": _summary(cold), "construct_snapshot": _summary(warm)}
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1 << 20 if sys.platform == "darwin" else 1 << 10), 1)
+
+
+def run_scale(factor: int, samples: int, ops: List[str], repeats: int = 3, seed: int = 0,
+              cached: bool = False, budget: Optional[float] = None) -> dict:
+    """Benchmark one dictionary scale (meant to run in its own process)."""
+    with tempfile.TemporaryDirectory(prefix=f"wj-bench-x{factor}-") as tmp:
+        paths = build_scaled_dictionaries(WordJoiner(snapshot_path=None), factor, tmp, seed)
+        entry = {"scale": factor, "operations": {}}
+        if "construct" in ops:
+            entry["operations"].update(time_construction(paths, repeats))
+        gc.collect()
+        wj = WordJoiner(snapshot_path=None, cache_sizes=None if cached else NO_CACHE, **paths).preload()
+        entry["roots"] = len(wj.root_set)
+        entry["compounds"] = len(wj.compound_map)
+        inputs = build_inputs(wj, samples, seed)
+        for op in ops:
+            if op == "construct":
+                continue
+            wj.clear_cache()
+            entry["operations"][op] = _summary(time_calls(getattr(wj, op), inputs[op], budget))
+        entry["peak_rss_mb"] = _peak_rss_mb()
+    return entry
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run(scales: List[int], samples: int = 2000, ops: Optional[List[str]] = None,
+        repeats: int = 3, seed: int = 0, cached: bool = False, budget: Optional[float] = 60.0) -> dict:
+    """
+    Benchmark every scale in a fresh process, so peak RSS is per scale and a
+    scale that runs out of memory is recorded as an error instead of ending the run.
+    """
+    ops = ops or OPERATIONS
+    results = []
+    for factor in scales:
+        with ProcessPoolExecutor(max_workers=1) as ex:
+            try:
+                entry = ex.submit(run_scale, factor, samples, ops, repeats, seed, cached, budget).result()
+            except BrokenProcessPool:
+                entry = {"scale": factor, "error": "worker process died (out of memory?)"}
+            except Exception as e:
+                entry = {"scale": factor, "error": f"{type(e).__name__}: {e}"}
+        results.append(entry)
+        _print_entry(entry)
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "samples": samples,
+        "budget_s": budget,
+        "seed": seed,
+        "cached": cached,
+        "results": results,
+    }
+
+
+def _print_entry(entry: dict):
+    if "error" in entry:
+        print(f"-- scale {entry['scale']}x: {entry['error']}")
+        return
+    print(f"-- scale {entry['scale']}x: {entry['roots']} roots, {entry['compounds']} compounds,"
+          f" peak RSS {entry['peak_rss_mb']} MB")
+    for op, s in entry["operations"].items():
+        lat = s["latency_us"]
+        print(f"   {op:<22} {s['calls']:>6} calls {s['ops_per_s']:>11.1f}/s  p50 {lat['p50']:>11.1f}us"
+              f"  p95 {lat['p95']:>11.1f}us  p99 {lat['p99']:>11.1f}us")
+
+
+def main(scales=(1, 10, 100), samples=2000, ops=None, repeats=3, seed=0, cached=False,
+         budget=60.0, out="benchmark_results.jsonl"):
+    report = run(list(scales), samples, ops, repeats, seed, cached, budget)
+    with open(out, "a", encoding="utf-8") as f:
+        f.write(json.dumps(report, ensure_ascii=False) + "\n")
+    print(f"Appended results to {out}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100],
+                        help="dictionary size multipliers")
+    parser.add_argument("--samples", type=int, default=2000, help="calls per operation and scale")
+    parser.add_argument("--budget", type=float, default=60.0,
+                        help="max seconds per operation and scale (0: no limit)")
+    parser.add_argument("--ops", nargs="+", choices=OPERATIONS, default=None)
+    parser.add_argument("--repeats", type=int, default=3, help="constructions per scale")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cached", action="store_true", help="keep the default method caches on")
+    parser.add_argument("--out", type=str, default="benchmark_results.jsonl")
+    args = parser.parse_args()
+    if args.scales and min(args.scales) < 1:
+        sys.exit("--scales must be >= 1")
+    main(args.scales, args.samples, args.ops, args.repeats, args.seed, args.cached,
+         args.budget or None, args.out)
@@ -0,0 +1,134 @@
+# benchmark_heavy_hitters.py
+# Accuracy / memory / speed of the Space-Saving pair counter used by
+# extract_compounds_from_wiki.py --capacity, against the exact Counter.
+#
+# The stream is the adjacent Kannada word pairs of the given text files, or,
+# without files, a seeded Zipf-distributed pair stream over pairs drawn from
+# root_words.csv (word frequencies in real text are close to Zipfian).
+# Each run appends one JSON line to --out.
+#
+#   python benchmark_heavy_hitters.py --pairs 2000000 --top 2500 --capacities 2500 10000 50000
+#   python benchmark_heavy_hitters.py corpus/*.txt --top 1000
+
+import argparse, bisect, csv, itertools, json, random, time, tracemalloc
+from collections import Counter
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from code.heavy_hitters import SpaceSaving
+from code.extract_compounds_from_wiki import tokenize
+
+ROOT_CSV = "../dictionaries/root_words.csv"
+
+
+def pairs_from_files(paths: List[str]) -> Iterator[Tuple[str, str]]:
+    for path in paths:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                toks = tokenize(line)
+                for w1, w2 in zip(toks, toks[1:]):
+                    if len(w1) >= 2 and len(w2) >= 2:
+                        yield w1, w2
+
+
+def zipf_pairs(n: int, vocab: int = 200000, s: float = 1.1, seed: int = 0) -> Iterator[Tuple[str, str]]:
+    """n pairs whose ranks follow Zipf(s) over `vocab` distinct pairs built from root words."""
+    rng = random.Random(seed)
+    with open(ROOT_CSV, encoding="utf-8", newline="") as f:
+        words = [r["word"] for r in csv.DictReader(f) if r.get("word")]
+    cum, total = [], 0.0
+    for rank in range(1, vocab + 1):
+        total += rank ** -s
+        cum.append(total)
+    # lazily materialized pair per rank, so the vocabulary costs nothing until drawn
+    table: Dict[int, Tuple[str, str]] = {}
+    for _ in range(n):
+        rank = bisect.bisect_left(cum, rng.random() * total)
+        pair = table.get(rank)
+        if pair is None:
+            pair = table[rank] = (rng.choice(words), rng.choice(words))
+        yield pair
+
+
+def _measure(counter, stream: Sequence) -> Tuple[float, int]:
+    """Feed the stream; returns (seconds, peak traced bytes)."""
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    if isinstance(counter, Counter):
+        counter.update(stream)
+    else:
+        counter.add_all(stream)
+    dt = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return dt, peak
+
+
+def evaluate(exact: Counter, sketch: SpaceSaving, k: int) -> dict:
+    true_top = exact.most_common(k)
+    true_keys = {key for key, _ in true_top}
+    kth = true_top[-1][1] if true_top else 0
+    top = sketch.top_k(k)
+    got_keys = {key for key, *_ in top}
+    abs_err = [c - exact[key] for key, c, _, _ in top]
+    return {
+        # ties at the k-th count make several top-k sets equally correct
+        "precision": round(sum(1 for key in got_keys if exact[key] >= kth) / max(1, len(got_keys)), 4),
+        "recall": round(len(true_keys & got_keys) / max(1, len(true_keys)), 4),
+        "guaranteed": sum(1 for *_, g in top if g),
+        "mean_overcount": round(sum(abs_err) / max(1, len(abs_err)), 2),
+        "max_overcount": max(abs_err, default=0),
+        "error_bound": sketch.max_error(),
+        "bound_holds": all(c - e <= exact[key] <= c for key, c, e, _ in top),
+    }
+
+
+def run(files: List[str], pairs: int, top: int, capacities: List[int], seed: int = 0) -> dict:
+    if files:
+        source = itertools.islice(pairs_from_files(files), pairs) if pairs else pairs_from_files(files)
+    else:
+        source = zipf_pairs(pairs, seed=seed)
+    # materialized before tracing, so time and peak memory cover the counters only
+    stream = list(source)
+    n = len(stream)
+
+    exact = Counter()
+    dt, peak = _measure(exact, stream)
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "source": files or f"zipf(s=1.1, seed={seed})",
+        "pairs": n, "distinct": len(exact), "top": top,
+        "exact": {"seconds": round(dt, 3), "peak_mb": round(peak / 2 ** 20, 2)},
+        "space_saving": [],
+    }
+    print(f"{n} pairs, {len(exact)} distinct; exact Counter: {dt:.2f}s, peak {peak / 2 ** 20:.1f} MB")
+    for cap in capacities:
+        sketch = SpaceSaving(max(cap, top))
+        dt, peak = _measure(sketch, stream)
+        entry = {"capacity": sketch.capacity, "seconds": round(dt, 3), "peak_mb": round(peak / 2 ** 20, 2)}
+        entry.update(evaluate(exact, sketch, top))
+        report["space_saving"].append(entry)
+        print(f"  capacity {sketch.capacity:>8}: {dt:.2f}s, peak {entry['peak_mb']:.1f} MB,"
+              f" precision {entry['precision']:.3f}, recall {entry['recall']:.3f},"
+              f" guaranteed {entry['guaranteed']}/{top}, max overcount {entry['max_overcount']}"
+              f" (bound {entry['error_bound']})")
+    return report
+
+
+def main(files=(), pairs=1000000, top=2500, capacities=(2500, 10000, 50000), seed=0,
+         out="benchmark_heavy_hitters.jsonl"):
+    report = run(list(files), pairs, top, list(capacities), seed)
+    with open(out, "a", encoding="utf-8") as f:
+        f.write(json.dumps(report, ensure_ascii=False) + "\n")
+    print(f"Appended results to {out}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("files", nargs="*", help="text files to take pairs from (default: synthetic Zipf)")
+    parser.add_argument("--pairs", type=int, default=1000000, help="stream length (with files: cap, 0 = all)")
+    parser.add_argument("--top", type=int, default=2500, help="k, as --target in the scraper")
+    parser.add_argument("--capacities", type=int, nargs="+", default=[2500, 10000, 50000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=str, default="benchmark_heavy_hitters.jsonl")
+    args = parser.parse_args()
+    main(args.files, args.pairs, args.top, args.capacities, args.seed, args.out)
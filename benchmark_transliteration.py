@@ -0,0 +1,112 @@
+# benchmark_transliteration.py
+# Speed of WordJoiner.transliterate (per call, cache off) and
+# transliterate_many (batch) on large romanized inputs, against the previous
+# pattern-list implementation kept below as a baseline.
+#
+# Inputs are root_words.csv entries romanized with benchmark.py's table and
+# sampled with a seed: single words, and with --words-per-line > 1, long
+# space-separated lines. "roundtrip" is the share of words that come back as
+# the original Kannada (the romanization is lossy, e.g. ತ/ಟ both give "t").
+# Each run appends one JSON line to --out.
+#
+#   python benchmark_transliteration.py --inputs 1000000
+#   python benchmark_transliteration.py --inputs 20000 --words-per-line 50
+
+import argparse, csv, json, random, re, time
+from typing import Callable, Dict, List
+
+from code.word_joiner import WordJoiner, DEFAULT_CACHE_SIZES
+from code.benchmark import _romanize
+
+ROOT_CSV = "../dictionaries/root_words.csv"
+
+
+def legacy_transliterate(latin: str) -> str:
+    """The implementation transliterate() replaced (for comparison only)."""
+    s=(latin or "").strip().lower()
+    if not s: return ""
+    patterns = [
+        ("sh","ಶ"),("ch","ಚ"),("kh","ಖ"),("gh","ಘ"),
+        ("th","ಥ"),("dh","ಧ"),("ph","ಫ"),("bh","ಭ"),
+        ("aa","ಾ"),("ii","ೀ"),("ee","ೀ"),("oo","ೋ"),
+        ("au","ೌ"),("ai","ೈ")
+    ]
+    out=""; i=0
+    while i < len(s):
+        matched=False
+        for pat,rep in patterns:
+            if s.startswith(pat,i):
+                out += rep; i += len(pat); matched=True; break
+        if matched: continue
+        ch=s[i]
+        table = {
+            "a":"ಅ","i":"ಇ","u":"ಉ","e":"ಎ","o":"ಒ",
+            "k":"ಕ","g":"ಗ","j":"ಜ","t":"ಟ","d":"ಡ",
+            "n":"ನ","p":"ಪ","b":"ಬ","m":"ಮ","y":"ಯ",
+            "r":"ರ","l":"ಲ","v":"ವ","s":"ಸ","h":"ಹ","w":"ವ"
+        }
+        out += table.get(ch,ch)
+        i += 1
+    out = re.sub(r"ಅಅ+", "ಆ", out)
+    return out
+
+
+def build_inputs(n: int, words_per_line: int = 1, seed: int = 0):
+    """(romanized inputs, original Kannada words per input)."""
+    rng = random.Random(seed)
+    with open(ROOT_CSV, encoding="utf-8", newline="") as f:
+        words = [r["word"] for r in csv.DictReader(f) if r.get("word")]
+    originals = [[rng.choice(words) for _ in range(words_per_line)] for _ in range(n)]
+    return [" ".join(_romanize(w) for w in line) for line in originals], originals
+
+
+def _time(fn: Callable[[], List[str]]):
+    t0 = time.perf_counter()
+    res = fn()
+    return res, time.perf_counter() - t0
+
+
+def run(inputs: int, words_per_line: int = 1, seed: int = 0, legacy: bool = True) -> dict:
+    texts, originals = build_inputs(inputs, words_per_line, seed)
+    chars = sum(map(len, texts))
+    wj = WordJoiner(snapshot_path=None, cache_sizes={name: 0 for name in DEFAULT_CACHE_SIZES})
+    impls: Dict[str, Callable[[], List[str]]] = {
+        "transliterate": lambda: [wj.transliterate(t) for t in texts],
+        "transliterate_many": lambda: list(wj.transliterate_many(texts)),
+    }
+    if legacy:
+        impls["legacy"] = lambda: [legacy_transliterate(t) for t in texts]
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "inputs": inputs, "words_per_line": words_per_line, "chars": chars,
+        "distinct": len(set(texts)), "seed": seed, "results": {},
+    }
+    print(f"{inputs} inputs x {words_per_line} words, {chars} chars, {report['distinct']} distinct")
+    for name, fn in impls.items():
+        out, dt = _time(fn)
+        ok = sum(got == exp for res, line in zip(out, originals) for got, exp in zip(res.split(" "), line))
+        entry = {"seconds": round(dt, 3), "inputs_per_s": round(inputs / dt, 1),
+                 "chars_per_s": round(chars / dt, 1), "roundtrip": round(ok / (inputs * words_per_line), 4)}
+        report["results"][name] = entry
+        print(f"  {name:<20} {dt:8.2f}s  {entry['inputs_per_s']:>12.1f} inputs/s"
+              f"  {entry['chars_per_s'] / 1e6:>7.2f}M chars/s  roundtrip {entry['roundtrip']:.3f}")
+    return report
+
+
+def main(inputs=1000000, words_per_line=1, seed=0, legacy=True, out="benchmark_transliteration.jsonl"):
+    report = run(inputs, words_per_line, seed, legacy)
+    with open(out, "a", encoding="utf-8") as f:
+        f.write(json.dumps(report, ensure_ascii=False) + "\n")
+    print(f"Appended results to {out}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--inputs", type=int, default=1000000, help="romanized inputs to convert")
+    parser.add_argument("--words-per-line", type=int, default=1, help="words per input (1: single words)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-legacy", action="store_true", help="skip the old implementation")
+    parser.add_argument("--out", type=str, default="benchmark_transliteration.jsonl")
+    args = parser.parse_args()
+    main(args.inputs, args.words_per_line, args.seed, not args.no_legacy, args.out)
@@ -1,4 +1,14 @@
 # cli.py
+# Interactive menu by default. Streaming mode for pipelines/batch jobs:
+#   python cli.py --mode sandhi|reverse|samasa|vibhakti --jsonl [--input FILE] [--output FILE]
+# reads one item per line and writes one JSON result per line.
+#   sandhi:   "word1<TAB or space>word2"
+#   vibhakti: "word" (default ending) or "word ending"
+#   reverse / samasa: "word"
+# A line may also be a JSON object with keys word1/word2, word/ending.
+
+import argparse, io, json, sys
+from itertools import islice
 
 from code.word_joiner import WordJoiner
 
@@ -59,5 +69,98 @@ def main():
         else:
             print("\nInvalid choice. Try again.")
 
+# ---------------------------
+# STREAMING (JSONL) MODE
+# ---------------------------
+STREAM_MODES = ("sandhi", "reverse", "samasa", "vibhakti")
+
+
+def _parse_line(line):
+    line = line.strip()
+    if line.startswith("{"):
+        try:
+            obj = json.loads(line)
+            w1 = obj.get("word1") or obj.get("word") or ""
+            w2 = obj.get("word2") or obj.get("ending") or ""
+            return str(w1), str(w2)
+        except ValueError:
+            pass
+    parts = line.split("\t") if "\t" in line else line.split()
+    w1 = parts[0].strip() if parts else ""
+    w2 = parts[1].strip() if len(parts) > 1 else ""
+    return w1, w2
+
+
+def _process_batch(wj, mode, items):
+    """Return one result dict per (w1, w2) item, in order."""
+    if mode == "sandhi":
+        return [{"word1": a, "word2": b, "result": r}
+                for (a, b), r in zip(items, wj.apply_sandhi_many(items))]
+    words = [a for a, _ in items]
+    if mode == "reverse":
+        return [{"word": w, "candidates": [list(c) for c in wj.reverse_sandhi(w)]} for w in words]
+    if mode == "samasa":
+        return [{"word": w, "split": list(sp) if sp else None}
+                for w, sp in zip(words, wj.validate_compound_many(words))]
+    # vibhakti
+    out = []
+    for w, e in items:
+        form, vid = wj.apply_vibhakti(w, e) if e else wj.apply_vibhakti_single(w)
+        det_id, suf = wj.detect_vibhakti(form)
+        out.append({"word": w, "ending": e or None, "output": form,
+                    "vibhakti_id": vid or det_id, "suffix": suf})
+    return out
+
+
+def stream(mode, src, dst, batch_size=1024):
+    """
+    Read items from src, write JSONL results to dst.
+    Works batch by batch with one warm WordJoiner, so memory stays constant
+    and output is flushed once per batch.
+    """
+    wj = WordJoiner()
+    lines = (l for l in src if l.strip())
+    n = 0
+    while True:
+        chunk = list(islice(lines, batch_size))
+        if not chunk:
+            break
+        results = _process_batch(wj, mode, [_parse_line(l) for l in chunk])
+        dst.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in results))
+        dst.flush()
+        n += len(results)
+    return n
+
+
+def run():
+    parser = argparse.ArgumentParser(description="Kannada word joiner")
+    parser.add_argument("--mode", choices=STREAM_MODES, help="streaming mode (omit for the interactive menu)")
+    parser.add_argument("--jsonl", action="store_true", help="read lines, write one JSON result per line")
+    parser.add_argument("--input", type=str, default=None, help="input file (default: stdin)")
+    parser.add_argument("--output", type=str, default=None, help="output file (default: stdout)")
+    parser.add_argument("--batch-size", type=int, default=1024)
+    args = parser.parse_args()
+
+    if not args.mode:
+        main()
+        return
+    if not args.jsonl:
+        parser.error("--mode currently requires --jsonl")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+
+    src = open(args.input, encoding="utf-8") if args.input else io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    dst = open(args.output, "w", encoding="utf-8") if args.output else io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+    try:
+        stream(args.mode, src, dst, args.batch_size)
+    finally:
+        if args.input:
+            src.close()
+        if args.output:
+            dst.close()
+        else:
+            dst.flush()
+
+
 if __name__ == "__main__":
-    main()
+    run()
@@ -0,0 +1,89 @@
+# completion_index.py
+# Ranked prefix completion over a fixed lexicon: the words are kept sorted, so
+# a prefix is one contiguous range found with two bisects, and a max segment
+# tree over the word scores pulls the best n of that range in O(n log N)
+# without looking at the rest of it.
+
+import array
+from bisect import bisect_left
+from heapq import heappush, heappop
+from typing import Dict, List
+
+_MAX_CHAR = "\U0010ffff"
+
+
+class CompletionIndex:
+    """
+    Prefix completions ranked by score (higher first), then shorter word,
+    then alphabetical order.
+    """
+    def __init__(self, scores: Dict[str, int]):
+        self.words: List[str] = sorted(w for w in scores if w)
+        # one integer priority per word: score first, shorter words break ties
+        self._prio = array.array("q", (scores[w] * 4096 - min(len(w), 4095) for w in self.words))
+        n = len(self.words)
+        size = 1
+        while size < n:
+            size <<= 1
+        self._size = size
+        tree = array.array("i", [-1]) * (2 * size)
+        tree[size:size + n] = array.array("i", range(n))
+        for i in range(size - 1, 0, -1):
+            tree[i] = self._better(tree[2 * i], tree[2 * i + 1])
+        self._tree = tree
+
+    def __len__(self):
+        return len(self.words)
+
+    def _better(self, a: int, b: int) -> int:
+        if a < 0:
+            return b
+        if b < 0:
+            return a
+        pa, pb = self._prio[a], self._prio[b]
+        return a if pa > pb or (pa == pb and a < b) else b
+
+    def _best_in(self, lo: int, hi: int) -> int:
+        """Index of the best word in words[lo:hi], or -1."""
+        tree, better = self._tree, self._better
+        best = -1
+        lo += self._size
+        hi += self._size
+        while lo < hi:
+            if lo & 1:
+                best = better(best, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                best = better(best, tree[hi])
+            lo >>= 1
+            hi >>= 1
+        return best
+
+    def prefix_range(self, prefix: str):
+        words = self.words
+        return bisect_left(words, prefix), bisect_left(words, prefix + _MAX_CHAR)
+
+    def count(self, prefix: str) -> int:
+        lo, hi = self.prefix_range(prefix)
+        return hi - lo
+
+    def complete(self, prefix: str, n: int = 8) -> List[str]:
+        """Up to n words starting with `prefix`, best first."""
+        lo, hi = self.prefix_range(prefix)
+        out: List[str] = []
+        if lo >= hi or n <= 0:
+            return out
+        prio = self._prio
+        # best-first over subranges: pop the best word, split its range around it
+        heap = []
+        i = self._best_in(lo, hi)
+        heappush(heap, (-prio[i], i, lo, hi))
+        while heap and len(out) < n:
+            _, i, l, h = heappop(heap)
+            out.append(self.words[i])
+            for a, b in ((l, i), (i + 1, h)):
+                if a < b:
+                    j = self._best_in(a, b)
+                    heappush(heap, (-prio[j], j, a, b))
+        return out
@@ -0,0 +1,143 @@
+# corpus_analyzer.py
+# Parallel corpus analysis: tokenize Kannada documents and run detect_vibhakti,
+# vibhakti_analyzer.analyze_word and validate_compound on every token.
+# Each input file is one document; large files are cut into line-aligned chunks
+# that are spread over a process pool (one warm WordJoiner per worker) and the
+# per-token results are merged back into one report per document.
+#
+# Usage:  python corpus_analyzer.py docs/*.txt --workers 8 --out reports.jsonl
+
+import argparse, json, sys
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from code.parallel import parallel_map, init_worker_engine, worker_engine
+from code.extract_compounds_from_wiki import tokenize
+
+# corpus vocabularies outgrow the default LRU sizes; these hold results for
+# repeated words across all the chunks a worker sees
+WORKER_CACHE_SIZES = {"validate_compound": 1 << 17, "detect_vibhakti": 1 << 17}
+
+
+def analyze_chunk(task: Tuple[str, str]) -> Tuple[str, Dict[str, tuple]]:
+    """
+    Analyze one chunk of a document.
+    Returns (doc_id, {token: (count, vibhakti_id, suffix, analyzer_vibhakti_id, split)}).
+    Each distinct token is analyzed once per chunk. The batch calls go through
+    the worker's WordJoiner LRU caches (WORKER_CACHE_SIZES), so a word seen in
+    an earlier chunk on the same worker is not recomputed while it stays cached.
+    """
+    doc_id, text = task
+    wj = worker_engine()
+    counts = Counter(tokenize(text))
+    tokens = list(counts)
+    detected = wj.detect_vibhakti_many(tokens)
+    splits = wj.validate_compound_many(tokens)
+    out = {}
+    for tok, (vid, suf), split in zip(tokens, detected, splits):
+        out[tok] = (counts[tok], vid, suf, wj.analyze_word(tok)["vibhakti_id"], split)
+    return doc_id, out
+
+
+def _read_chunks(path: str, chunk_chars: int) -> Iterator[str]:
+    buf, size = [], 0
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            buf.append(line); size += len(line)
+            if size >= chunk_chars:
+                yield "".join(buf)
+                buf, size = [], 0
+    if buf:
+        yield "".join(buf)
+
+
+def iter_chunks(paths: List[str], chunk_chars: int = 1 << 20) -> Iterator[Tuple[str, str, bool]]:
+    """Yield (doc_id, text, is_last_chunk) of roughly chunk_chars, cut at line boundaries."""
+    for path in paths:
+        prev = None
+        for text in _read_chunks(path, chunk_chars):
+            if prev is not None:
+                yield path, prev, False
+            prev = text
+        yield path, prev or "", True
+
+
+class _DocAccumulator:
+    def __init__(self):
+        self.tokens: Dict[str, list] = {}
+
+    def add(self, chunk: Dict[str, tuple]):
+        for tok, (count, vid, suf, aid, split) in chunk.items():
+            cur = self.tokens.get(tok)
+            if cur is None:
+                self.tokens[tok] = [count, vid, suf, aid, split]
+            else:
+                cur[0] += count
+
+    def report(self, doc_id: str, top: int = 20) -> dict:
+        total = 0
+        vibhakti, analyzer, suffixes = Counter(), Counter(), Counter()
+        compounds = Counter()
+        for tok, (count, vid, suf, aid, split) in self.tokens.items():
+            total += count
+            vibhakti[vid or "none"] += count
+            analyzer[str(aid)] += count
+            if suf:
+                suffixes[suf] += count
+            if split:
+                compounds[(tok, split[0], split[1])] += count
+        return {
+            "document": doc_id,
+            "tokens": total,
+            "unique_tokens": len(self.tokens),
+            "vibhakti": dict(vibhakti),
+            "analyzer_vibhakti": dict(analyzer),
+            "top_suffixes": suffixes.most_common(top),
+            "compound_tokens": sum(compounds.values()),
+            "top_compounds": [
+                {"word": w, "part1": a, "part2": b, "count": c}
+                for (w, a, b), c in compounds.most_common(top)
+            ],
+        }
+
+
+def _analyze_tagged(task: Tuple[str, str, bool]) -> Tuple[str, bool, Dict[str, tuple]]:
+    doc_id, text, last = task
+    return doc_id, last, analyze_chunk((doc_id, text))[1]
+
+
+def analyze_corpus(paths: List[str], workers: Optional[int] = None,
+                   chunk_chars: int = 1 << 20) -> Iterator[dict]:
+    """
+    Analyze documents in parallel and yield one report per document, in
+    input order. Chunks go through parallel_map, so memory stays bounded
+    however large the corpus is; workers=1 runs in-process.
+    """
+    acc = _DocAccumulator()
+    chunks = iter_chunks(paths, chunk_chars)
+    for doc_id, last, res in parallel_map(_analyze_tagged, chunks, workers,
+                                          init_worker_engine, (WORKER_CACHE_SIZES,)):
+        acc.add(res)
+        if last:
+            yield acc.report(doc_id)
+            acc = _DocAccumulator()
+
+
+def main(paths, workers=None, out=None, chunk_chars=1 << 20):
+    f = open(out, "w", encoding="utf-8") if out else sys.stdout
+    try:
+        for rep in analyze_corpus(paths, workers, chunk_chars):
+            f.write(json.dumps(rep, ensure_ascii=False) + "\n")
+    finally:
+        if out:
+            f.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("paths", nargs="+", help="UTF-8 text files, one document each")
+    parser.add_argument("--workers", type=int, default=None, help="process count (default: all cores)")
+    parser.add_argument("--chunk-chars", type=int, default=1 << 20)
+    parser.add_argument("--out", type=str, default=None, help="JSONL report file (default: stdout)")
+    args = parser.parse_args()
+    main(args.paths, args.workers, args.out, args.chunk_chars)
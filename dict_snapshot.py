@@ -0,0 +1,113 @@
+# dict_snapshot.py
+# Versioned binary (pickle) snapshot of WordJoiner's dictionaries and derived indexes.
+# The snapshot records the size, mtime and sha256 of every source CSV; it is
+# treated as stale (and rebuilt by WordJoiner) as soon as any source changes.
+#
+# Build explicitly:  python dict_snapshot.py [--out PATH]
+
+import argparse, hashlib, os, pickle, tempfile
+from typing import Any, Dict, List, Optional
+
+SNAPSHOT_VERSION = 4
+_MAGIC = "kannada-word-joiner-snapshot"
+
+
+def _sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def source_fingerprint(paths: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """path -> {size, mtime_ns, sha256}, or None for a missing file."""
+    fp = {}
+    for p in paths:
+        if os.path.exists(p):
+            st = os.stat(p)
+            fp[p] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": _sha256(p)}
+        else:
+            fp[p] = None
+    return fp
+
+
+def _is_fresh(recorded: Dict[str, Optional[Dict[str, Any]]], paths: List[str]) -> bool:
+    if sorted(recorded) != sorted(paths):
+        return False
+    for p in paths:
+        rec = recorded[p]
+        if not os.path.exists(p):
+            if rec is not None:
+                return False
+            continue
+        if rec is None:
+            return False
+        st = os.stat(p)
+        if st.st_size != rec["size"]:
+            return False
+        # unchanged mtime: trust it; touched file: fall back to the content hash
+        if st.st_mtime_ns != rec["mtime_ns"] and _sha256(p) != rec["sha256"]:
+            return False
+    return True
+
+
+def load_snapshot(path: str, sources: List[str]) -> Optional[Dict[str, Any]]:
+    """Return the stored state if the snapshot exists, matches SNAPSHOT_VERSION
+    and every source file is unchanged; otherwise None."""
+    try:
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(payload, dict) or payload.get("magic") != _MAGIC:
+        return None
+    if payload.get("version") != SNAPSHOT_VERSION:
+        return None
+    if not _is_fresh(payload.get("sources") or {}, sources):
+        return None
+    return payload.get("state")
+
+
+def save_snapshot(path: str, state: Dict[str, Any], sources: List[str]) -> bool:
+    """Atomically write a snapshot; returns False if the location is not writable."""
+    payload = {
+        "magic": _MAGIC,
+        "version": SNAPSHOT_VERSION,
+        "sources": source_fingerprint(sources),
+        "state": state,
+    }
+    # unique temp name: pool workers may all autosave the same stale snapshot at once
+    tmp = None
+    try:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".",
+                                   prefix=os.path.basename(path) + ".", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.chmod(tmp, 0o644)   # mkstemp creates 0600
+        os.replace(tmp, path)
+        return True
+    except OSError:
+        if tmp:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+        return False
+
+
+def main(out=None):
+    from code.word_joiner import WordJoiner
+    wj = WordJoiner(snapshot_path=None)
+    out = out or os.path.join(os.path.dirname(wj.root_csv), "word_joiner.snapshot")
+    if wj.save_snapshot(out):
+        print(f"Wrote snapshot (v{SNAPSHOT_VERSION}) to {out}")
+    else:
+        print(f"Could not write snapshot to {out}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out", type=str, default=None)
+    args = parser.parse_args()
+    main(args.out)
@@ -1,53 +1,64 @@
 # extract_compounds_from_wiki.py
 
-import requests, argparse, csv, time, re, os
+import argparse, csv, re, os
 from collections import Counter
 from tqdm import tqdm
 
-API = "https://kn.wikipedia.org/w/api.php"
-HEADERS = {"User-Agent":"CompoundExtractor/1.0"}
+from code.wiki_fetcher import WikiFetcher, API
+from code.heavy_hitters import SpaceSaving
+from code.scrape_checkpoint import CsvAppender, ProcessedTitles, read_rows, titles_log_path
 
-def get_random_pages(n=100):
-    params = {
-        "action":"query",
-        "list":"random",
-        "rnlimit":n,
-        "rnnamespace":0,
-        "format":"json"
-    }
-    r = requests.get(API, params=params, headers=HEADERS, timeout=20).json()
-    return [p['title'] for p in r['query']['random']]
-
-def get_page_text(title):
-    params = {
-        "action":"query",
-        "prop":"extracts",
-        "explaintext":"1",
-        "titles":title,
-        "format":"json"
-    }
-    r = requests.get(API, params=params, headers=HEADERS, timeout=20).json()
-    pages = r['query']['pages']
-    page = next(iter(pages.values()))
-    return page.get('extract','')
+HEADERS = {"User-Agent":"CompoundExtractor/1.0"}
 
 def tokenize(text):
     # Kannada Unicode range \u0C80-\u0CFF
     tokens = re.findall(r'[\u0C80-\u0CFF]+', text)
     return tokens
 
-def main(target=2500, outpath="../dictionaries/compound_words.csv"):
-    pairs = Counter()
+def pairs_log_path(outpath):
+    return outpath + ".pairs.csv"
 
-    # progress bar
-    pbar = tqdm(total=target, desc="Collecting compound candidates")
+def main(target=2500, outpath="../dictionaries/compound_words.csv", api=API, workers=8, rate=10.0,
+         resume=False, flush_every=100, capacity=0, max_pages=0, overwrite=False):
+    # capacity > 0 counts pairs in a fixed-size Space-Saving sketch instead of
+    # an exact Counter (memory stays bounded on long runs; counts may be
+    # overestimated by at most pairs seen / capacity). max_pages > 0 stops
+    # after that many pages instead of at `target` distinct pairs.
+    pairs = SpaceSaving(max(capacity, target)) if capacity else Counter()
+
+    def finished():
+        return pages >= max_pages if max_pages else len(pairs) >= target
+
+    # never clobber a finished compound list by accident
+    if not (resume or overwrite) and os.path.exists(outpath) and os.path.getsize(outpath) > 0:
+        raise FileExistsError(f"{outpath} already has data")
 
-    while len(pairs) < target:
-        titles = get_random_pages(60)
+    # Per-page pair counts are appended to <out>.pairs.csv as pages finish;
+    # the final CSV below is derived from them. With resume the log is
+    # replayed to rebuild the counts.
+    log_path = pairs_log_path(outpath)
+    if resume:
+        for r in read_rows(log_path):
+            pairs.update({(r["word1"], r["word2"]): int(r["count"])})
 
-        for t in titles:
-            text = get_page_text(t)
+    # progress bar
+    pages = 0
+    if max_pages:
+        pbar = tqdm(total=max_pages, desc="Scanning pages")
+    else:
+        pbar = tqdm(total=target, desc="Collecting compound candidates")
+        pbar.update(min(len(pairs), target))
+
+    with CsvAppender(log_path, ["word1", "word2", "count"], resume, flush_every, overwrite=overwrite) as log, \
+         ProcessedTitles(titles_log_path(outpath), resume, results=log, overwrite=overwrite) as done, \
+         WikiFetcher(api, HEADERS, workers=workers, rate=rate) as fetcher:
+        if resume:
+            print(f"Resuming: {len(pairs)} pairs, {len(done)} pages already processed")
+        for title, text in fetcher.iter_random_extracts(per_round=60 * workers, skip=done):
+            if finished():
+                break
             toks = tokenize(text)
+            page_pairs = Counter()
 
             for i in range(len(toks)-1):
                 w1, w2 = toks[i], toks[i+1]
@@ -55,18 +66,24 @@ def main(target=2500, outpath="../dictionaries/compound_words.csv"):
                 if len(w1) < 2 or len(w2) < 2:
                     continue
 
-                pairs[(w1, w2)] += 1
-                pbar.update(1)
+                page_pairs[(w1, w2)] += 1
 
-                if len(pairs) >= target:
-                    break
+            before = len(pairs)
+            pairs.update(page_pairs)
+            pages += 1
+            pbar.update(1 if max_pages else min(len(pairs), target) - min(before, target))
+            # pairs first: a title flush also flushes the pairs log, so a
+            # logged title never points at lost rows
+            log.writerows({"word1": w1, "word2": w2, "count": c} for (w1, w2), c in page_pairs.items())
+            done.add(title)
 
-            if len(pairs) >= target:
-                break
+    pbar.close()
 
-        time.sleep(1)
+    write_compounds(pairs, target, outpath)
 
-    pbar.close()
+def write_compounds(pairs, target, outpath):
+    """Write the `target` most frequent pairs (Counter or SpaceSaving) as compound_words.csv rows."""
+    sketch = isinstance(pairs, SpaceSaving)
 
     # ensure directory exists
     out_dir = os.path.dirname(outpath)
@@ -77,6 +94,8 @@ def main(target=2500, outpath="../dictionaries/compound_words.csv"):
     rows = []
     for (w1, w2), count in pairs.most_common(target):
         combined = w1 + w2
+        if sketch:
+            count -= pairs.error((w1, w2))   # bucket on the guaranteed lower bound
         freq = "high" if count > 10 else ("medium" if count > 3 else "low")
         rows.append({
             "word1": w1,
@@ -92,10 +111,28 @@ def main(target=2500, outpath="../dictionaries/compound_words.csv"):
             writer.writerow(r)
 
     print(f"\n✔ Successfully wrote {len(rows)} compounds to {outpath}")
+    if sketch:
+        print(f"  Space-Saving: {pairs.total} pairs seen, counts overestimated by at most {pairs.max_error()}")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--target", type=int, default=2500)
     parser.add_argument("--out", type=str, default="../dictionaries/compound_words.csv")
+    parser.add_argument("--api", type=str, default=API, help="MediaWiki API url (e.g. a wiki_stub_server.py)")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent API requests")
+    parser.add_argument("--rate", type=float, default=10.0, help="max API requests per second (0: no limit)")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue an interrupted run from <out>.pairs.csv, skipping pages already processed")
+    parser.add_argument("--flush-every", type=int, default=100, help="flush the pair log every N rows")
+    parser.add_argument("--capacity", type=int, default=0,
+                        help="count pairs in a fixed-size Space-Saving sketch of this many slots (0: exact)")
+    parser.add_argument("--max-pages", type=int, default=0,
+                        help="stop after this many pages instead of at --target distinct pairs")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="replace an existing non-empty --out and its .pairs/.titles logs")
     args = parser.parse_args()
-    main(args.target, args.out)
+    try:
+        main(args.target, args.out, args.api, args.workers, args.rate, args.resume, args.flush_every,
+             args.capacity, args.max_pages, args.overwrite)
+    except FileExistsError as e:
+        parser.error(f"{e}; pass --resume to continue it or --overwrite to replace it")
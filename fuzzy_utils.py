@@ -1,26 +1,81 @@
 # fuzzy_utils.py
 import difflib
+import heapq
+from collections import Counter, defaultdict
 
 def norm_str(s: str) -> str:
     """Normalize string for comparison."""
     return s.lower().strip()
 
-def fuzzy_matches(word: str, candidates: list, cutoff: float = 0.6):
-    """Return list of (candidate, score) with score >= cutoff."""
-    word_n = norm_str(word)
-    cand_norm = [norm_str(c) for c in candidates]
-    matches = difflib.get_close_matches(word_n, cand_norm, n=10, cutoff=cutoff)
+class FuzzyIndex:
+    """
+    Reusable fuzzy-match index over a fixed candidate pool.
 
-    results = []
-    for m in matches:
+    Candidates are normalized once and posted into a character inverted
+    index. A query sums per-character overlaps from the postings, which is
+    exactly difflib's quick_ratio numerator, so only candidates that could
+    reach the cutoff are scored with SequenceMatcher.ratio. Results are the
+    same as running difflib.get_close_matches over the whole pool.
+    """
+    def __init__(self, candidates):
+        self._original = {}          # normalized -> first original string
+        self._keys = []              # normalized keys, pool order
+        self._postings = defaultdict(list)   # char -> [(key_idx, count)]
         for c in candidates:
-            if norm_str(c) == m:
-                score = difflib.SequenceMatcher(None, word_n, m).ratio()
-                results.append((c, score))
-                break
-    return sorted(results, key=lambda x: x[1], reverse=True)
+            k = norm_str(c)
+            if k in self._original:
+                continue
+            self._original[k] = c
+            idx = len(self._keys)
+            self._keys.append(k)
+            for ch, cnt in Counter(k).items():
+                self._postings[ch].append((idx, cnt))
 
-def best_match(word: str, candidates: list, cutoff: float = 0.6):
+    def __len__(self):
+        return len(self._keys)
+
+    def _survivors(self, word_n: str, cutoff: float):
+        """Keys whose quick_ratio against word_n is >= cutoff."""
+        if cutoff <= 0 or not word_n:
+            return self._keys
+        overlap = defaultdict(int)
+        for ch, qc in Counter(word_n).items():
+            for idx, cc in self._postings.get(ch, ()):
+                overlap[idx] += qc if qc < cc else cc
+        lq = len(word_n)
+        keys = self._keys
+        return [keys[i] for i, m in overlap.items()
+                if 2.0 * m / (lq + len(keys[i])) >= cutoff]
+
+    def top_k(self, word: str, n: int = 10, cutoff: float = 0.6):
+        """Return up to n (candidate, score) pairs with score >= cutoff, best first."""
+        if not n > 0:
+            raise ValueError("n must be > 0: %r" % (n,))
+        if not 0.0 <= cutoff <= 1.0:
+            raise ValueError("cutoff must be in [0.0, 1.0]: %r" % (cutoff,))
+        word_n = norm_str(word)
+        s = difflib.SequenceMatcher()
+        s.set_seq2(word_n)
+        scored = []
+        for x in self._survivors(word_n, cutoff):
+            s.set_seq1(x)
+            if s.real_quick_ratio() >= cutoff and \
+               s.quick_ratio() >= cutoff:
+                r = s.ratio()
+                if r >= cutoff:
+                    scored.append((r, x))
+        results = [(self._original[m], difflib.SequenceMatcher(None, word_n, m).ratio())
+                   for _, m in heapq.nlargest(n, scored)]
+        return sorted(results, key=lambda x: x[1], reverse=True)
+
+def fuzzy_matches(word: str, candidates, cutoff: float = 0.6, n: int = 10):
+    """Return list of (candidate, score) with score >= cutoff.
+    `candidates` may be a list or a prebuilt FuzzyIndex."""
+    if not isinstance(candidates, FuzzyIndex):
+        candidates = FuzzyIndex(candidates)
+    return candidates.top_k(word, n=n, cutoff=cutoff)
+
+def best_match(word: str, candidates, cutoff: float = 0.6):
     """Return best matching candidate or original word."""
     matches = fuzzy_matches(word, candidates, cutoff)
     if matches:
@@ -1,48 +1,96 @@
 # generate_test_cases.py
-import pandas as pd, csv, argparse, random
+# Seeded, vectorized test-case generation: valid pairs come from the compound
+# dictionary, negatives are random root pairings drawn in one batch, and rows
+# are written in chunks, so 1M+ case corpora are fast and the same seed always
+# gives the same file.
+#
+# --expected sandhi fills expected_result with WordJoiner.apply_sandhi (run on
+# a process pool) instead of the dictionary/concatenated form, for regression
+# and load corpora that pin the current engine output.
+#
+#   python generate_test_cases.py --target 1000000 --seed 42 --out big.csv
+#   python generate_test_cases.py --target 200000 --seed 1 --expected sandhi --workers 8
+import pandas as pd, numpy as np, argparse, contextlib, os
+from typing import List, Tuple
 from tqdm import tqdm
 
-def main(target=500, out="../test_cases/word_pairs_test.csv"):
+from code.parallel import (INFLIGHT_PER_WORKER, imap_ordered, init_worker_engine, resolve_workers,
+                           worker_engine, worker_pool)
+
+FIELDNAMES = ["test_id","word1","word2","expected_result","sandhi_rule_used","is_valid_compound"]
+
+
+def _sandhi_block(pairs: List[Tuple[str, str]]) -> List[str]:
+    return list(worker_engine().apply_sandhi_many(pairs))
+
+
+def _sandhi_results(pool, workers: int, w1: np.ndarray, w2: np.ndarray, block: int = 2000) -> List[str]:
+    pairs = list(zip(w1.tolist(), w2.tolist()))
+    blocks = (pairs[i:i + block] for i in range(0, len(pairs), block))
+    results = imap_ordered(pool, _sandhi_block, blocks, workers * INFLIGHT_PER_WORKER)
+    return [res for part in results for res in part]
+
+
+def main(target=500, out="../test_cases/word_pairs_test.csv", seed=None, chunk_size=100000,
+         expected="concat", workers=None, valid_fraction=0.6):
     comp = pd.read_csv("../dictionaries/compound_words.csv", dtype=str).fillna('')
     roots = pd.read_csv("../dictionaries/root_words.csv", dtype=str).fillna('')
-    rows = []
-    # add valid pairs from compounds (as many as possible)
-    for idx, r in comp.iterrows():
-        if len(rows) >= target*0.6:
-            break
-        rows.append({
-            "test_id": len(rows)+1,
-            "word1": r['word1'],
-            "word2": r['word2'],
-            "expected_result": r['combined'],
-            "sandhi_rule_used": "",
-            "is_valid_compound":"yes"
-        })
-    # add negatives (random pairings)
-    while len(rows) < target:
-        w1 = roots.sample(1).iloc[0]['word']
-        w2 = roots.sample(1).iloc[0]['word']
-        combined = w1 + w2
-        rows.append({
-            "test_id": len(rows)+1,
-            "word1": w1,
-            "word2": w2,
-            "expected_result": combined,
-            "sandhi_rule_used": "",
-            "is_valid_compound":"no"
-        })
-    # save
-    with open(out,"w",encoding="utf-8",newline="") as f:
-        fieldnames = ["test_id","word1","word2","expected_result","sandhi_rule_used","is_valid_compound"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
-    print(f"Wrote {len(rows)} test cases to {out}")
+    rng = np.random.default_rng(seed)
+
+    # valid pairs from compounds (as many as possible, up to valid_fraction)
+    n_valid = min(len(comp), int(np.ceil(target * valid_fraction)), target)
+    valid = comp.iloc[:n_valid]
+    # negatives: every random pairing drawn in one batch
+    root_words = roots['word'].to_numpy(dtype=object)
+    neg_idx = rng.integers(0, len(root_words), size=(target - n_valid, 2))
+
+    w1 = np.concatenate([valid['word1'].to_numpy(dtype=object), root_words[neg_idx[:, 0]]])
+    w2 = np.concatenate([valid['word2'].to_numpy(dtype=object), root_words[neg_idx[:, 1]]])
+    is_valid = np.where(np.arange(target) < n_valid, "yes", "no").astype(object)
+    combined = valid['combined'].to_numpy(dtype=object)
+
+    out_dir = os.path.dirname(out)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+
+    workers = resolve_workers(workers)
+    pool_cm = worker_pool(workers, init_worker_engine) if expected == "sandhi" else contextlib.nullcontext()
+    with pool_cm as pool, \
+         open(out, "w", encoding="utf-8", newline="") as f, \
+         tqdm(total=target, desc="Writing test cases") as pbar:
+        for start in range(0, target, chunk_size):
+            end = min(start + chunk_size, target)
+            c1, c2 = w1[start:end], w2[start:end]
+            if expected == "sandhi":
+                res = np.array(_sandhi_results(pool, workers, c1, c2), dtype=object)
+            else:
+                res = c1 + c2
+                k = max(0, min(end, n_valid) - start)
+                res[:k] = combined[start:start + k]
+            chunk = pd.DataFrame({
+                "test_id": np.arange(start + 1, end + 1),
+                "word1": c1,
+                "word2": c2,
+                "expected_result": res,
+                "sandhi_rule_used": "",
+                "is_valid_compound": is_valid[start:end],
+            }, columns=FIELDNAMES)
+            chunk.to_csv(f, header=(start == 0), index=False)
+            pbar.update(end - start)
+    print(f"Wrote {target} test cases to {out}")
 
 if __name__=="__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--target", type=int, default=500)
     parser.add_argument("--out", type=str, default="../test_cases/word_pairs_test.csv")
+    parser.add_argument("--seed", type=int, default=None, help="same seed, same file")
+    parser.add_argument("--chunk-size", type=int, default=100000, help="rows written per chunk")
+    parser.add_argument("--expected", choices=["concat", "sandhi"], default="concat",
+                        help="expected_result: dictionary/concatenated form, or WordJoiner.apply_sandhi output")
+    parser.add_argument("--workers", type=int, default=None, help="processes for --expected sandhi")
     args = parser.parse_args()
-    main(args.target, args.out)
+    if args.target < 1:
+        parser.error("--target must be at least 1")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    main(args.target, args.out, args.seed, args.chunk_size, args.expected, args.workers)
@@ -1,8 +1,204 @@
 # code/gui.py
 import tkinter as tk
 from tkinter import ttk, messagebox
+import queue, threading, traceback
 from code.word_joiner import WordJoiner
 
+LIVE_DEBOUNCE_MS = 250   # quiet time after the last keystroke before live analysis runs
+POLL_MS = 30             # how often the Tk loop picks up worker results
+COMPLETIONS = 8          # rows in the autocomplete dropdown
+
+
+class EngineWorker:
+    """
+    Owns the WordJoiner on one background thread. Jobs are (channel, fn, args);
+    fn(wj, *args) runs on the worker and its result is handed back through
+    results() for the Tk loop to poll. Jobs older than the latest token for
+    the same channel are dropped before they run (stale live keystrokes).
+    """
+    def __init__(self, factory=WordJoiner):
+        self._factory = factory
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._latest = {}            # channel -> newest token submitted
+        self._lock = threading.Lock()
+        self._token = 0
+        self.ready = threading.Event()
+        self.error = None
+        self.engine = None           # the WordJoiner, once ready
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def submit(self, channel, fn, *args):
+        with self._lock:
+            self._token += 1
+            token = self._latest[channel] = self._token
+        self._jobs.put((channel, token, fn, args))
+        return token
+
+    def is_current(self, channel, token):
+        with self._lock:
+            return self._latest.get(channel) == token
+
+    def results(self):
+        while True:
+            try:
+                yield self._results.get_nowait()
+            except queue.Empty:
+                return
+
+    def _run(self):
+        try:
+            wj = self._factory().preload()
+        except Exception as e:
+            self.error = e
+            self._results.put(("engine", 0, None, traceback.format_exc()))
+            return
+        self.engine = wj
+        self.ready.set()
+        self._results.put(("engine", 0, None, None))
+        while True:
+            channel, token, fn, args = self._jobs.get()
+            if not self.is_current(channel, token):
+                continue
+            try:
+                self._results.put((channel, token, fn(wj, *args), None))
+            except Exception:
+                self._results.put((channel, token, None, traceback.format_exc()))
+
+
+# =============================================================
+# Engine calls (run on the worker thread)
+# =============================================================
+def analyze(wj, mode, w1, w2):
+    # ---------------- SANDHI ----------------
+    if mode == "sandhi":
+        res = wj.apply_sandhi(w1, w2)
+        return f"ಸಂಧಿ ಫಲಿತಾಂಶ:\n{res}"
+
+    # ---------------- REVERSE SANDHI ----------------
+    if mode == "reverse_sandhi":
+        cands = wj.reverse_sandhi(w1)
+        if not cands:
+            return "ಯಾವುದೇ ಸಂಧಿ ವಿಭಾಗ ಸಿಕ್ಕಿಲ್ಲ."
+        lines = ["Reverse Sandhi candidates:\n"]
+        for i,(a,b) in enumerate(cands[:10], start=1):
+            lines.append(f"{i}) ಪದ 1: {a}\n    ಪದ 2: {b}\n")
+        return "\n".join(lines)
+
+    # ---------------- SAMĀSA ----------------
+    if mode == "samasa":
+        sp = wj.validate_compound(w1)
+        if sp:
+            a,b = sp
+            return f"ಸಮಾಸ ವಿಚ್ಛೇದ:\nಪದ 1: {a}\nಪದ 2: {b}"
+        sugg = wj.get_suggestions(w1, 8)
+        if sugg:
+            return "ಸಮಾಸ ಸಿಕ್ಕಿಲ್ಲ.\nಸೂചനೆಗಳು:\n" + ", ".join(sugg)
+        return "ಸಮಾಸ ಸಿಕ್ಕಿಲ್ಲ."
+
+    # ---------------- VIBHAKTI ----------------
+    if mode == "vibhakti":
+        out, vid = wj.apply_vibhakti_single(w1)
+        det_id, _ = wj.detect_vibhakti(out)
+        final_id = vid or det_id or "unknown"
+        return f"ವಿಭಕ್ತಿ ರೂಪ: {out}\nವಿಭಕ್ತಿ ಸಂಖ್ಯೆ: {final_id}"
+
+    return "Unknown mode."
+
+def fuzzy_test(wj):
+    lines = []
+
+    lines.append("Sandhi Test:\n" +
+                 wj.apply_sandhi("shakthi", "abhimaana"))
+
+    vb, _ = wj.apply_vibhakti_single("raama")
+    lines.append("\nVibhakti Test:\n" + vb)
+
+    sm = wj.validate_compound("ಲಕ್ಷ್ಮೀನಾರಾಯಣ")
+    lines.append("\nSamāsa Test:\n" + str(sm))
+
+    return "\n\n".join(lines)
+
+class CompletionDropdown:
+    """
+    Prefix-completion list under an Entry. complete(prefix) is called
+    synchronously on every keystroke, so it must be fast (WordJoiner.complete
+    is well under a millisecond); it may return [] while the engine loads.
+    Down/Up move, Return/Tab/click accept, Escape closes.
+    """
+    def __init__(self, entry, complete, on_pick=None):
+        self.entry = entry
+        self.complete = complete
+        self.on_pick = on_pick
+        self.top = tk.Toplevel(entry)
+        self.top.withdraw()
+        self.top.overrideredirect(True)
+        self.box = tk.Listbox(self.top, font=("Nirmala UI", 13), height=COMPLETIONS,
+                              activestyle="none", exportselection=False)
+        self.box.pack(fill="both", expand=True)
+        self.box.bind("<ButtonRelease-1>", lambda e: self.accept())
+        entry.bind("<KeyRelease>", self.on_key, add="+")
+        entry.bind("<Down>", lambda e: self.move(1))
+        entry.bind("<Up>", lambda e: self.move(-1))
+        entry.bind("<Return>", self.on_accept_key)
+        entry.bind("<Tab>", self.on_accept_key)
+        entry.bind("<Escape>", lambda e: self.hide())
+        # give a click on the list time to land before closing
+        entry.bind("<FocusOut>", lambda e: entry.after(150, self.hide), add="+")
+
+    def visible(self):
+        return self.top.winfo_viewable()
+
+    def on_key(self, event):
+        if event.keysym in ("Up", "Down", "Return", "Tab", "Escape"):
+            return
+        prefix = self.entry.get().strip()
+        items = self.complete(prefix) if prefix else []
+        if not items or items == [prefix]:
+            self.hide()
+            return
+        self.box.delete(0, tk.END)
+        for w in items:
+            self.box.insert(tk.END, w)
+        self.box.config(height=len(items))
+        self.top.geometry(f"{self.entry.winfo_width()}x{self.box.winfo_reqheight()}"
+                          f"+{self.entry.winfo_rootx()}+{self.entry.winfo_rooty() + self.entry.winfo_height()}")
+        self.top.deiconify()
+        self.top.lift()
+
+    def move(self, step):
+        if not self.visible():
+            return None
+        cur = self.box.curselection()
+        i = (cur[0] + step) if cur else (0 if step > 0 else self.box.size() - 1)
+        i = max(0, min(i, self.box.size() - 1))
+        self.box.selection_clear(0, tk.END)
+        self.box.selection_set(i)
+        self.box.see(i)
+        return "break"
+
+    def on_accept_key(self, event):
+        if self.visible() and self.box.curselection():
+            self.accept()
+            return "break"
+        self.hide()
+        return None
+
+    def accept(self):
+        cur = self.box.curselection()
+        if cur:
+            self.entry.delete(0, tk.END)
+            self.entry.insert(0, self.box.get(cur[0]))
+            self.entry.icursor(tk.END)
+        self.hide()
+        self.entry.focus_set()
+        if self.on_pick:
+            self.on_pick()
+
+    def hide(self):
+        self.top.withdraw()
+
+
 class WordJoinerGUI:
     def __init__(self, root):
         self.root = root
@@ -10,7 +206,10 @@ class WordJoinerGUI:
         self.root.state("zoomed")
         self.root.configure(bg="#e8eef3")
 
-        self.wj = WordJoiner()
+        # the engine loads and runs on a background thread; see poll_results()
+        self.worker = EngineWorker()
+        self._live_after = None
+        self._pending = None          # (token, mode, w1, w2) of the running explicit request
 
         # Center card
         self.card = tk.Frame(self.root, bg="white", bd=0, relief="flat")
@@ -64,6 +263,16 @@ class WordJoinerGUI:
         ttk.Button(btnf, text="Clear", command=self.clear_all, width=12).grid(row=0, column=2, padx=8)
         ttk.Button(btnf, text="Copy Result", command=self.copy_result, width=14).grid(row=0, column=3, padx=8)
 
+        self.live = tk.BooleanVar(value=False)
+        ttk.Checkbutton(btnf, text="Live", variable=self.live, command=self.schedule_live).grid(row=0, column=4, padx=8)
+        for e in (self.e1, self.e2):
+            e.bind("<KeyRelease>", self.schedule_live, add="+")
+        self.dropdowns = [CompletionDropdown(e, self.complete, self.schedule_live) for e in (self.e1, self.e2)]
+
+        self.status = tk.Label(self.card, text="Loading dictionaries…", font=("Nirmala UI", 11),
+                               bg="white", fg="#5b6b73")
+        self.status.pack()
+
         # Output
         tk.Label(self.card, text="Result:", font=("Nirmala UI", 15), bg="white").pack()
 
@@ -85,6 +294,68 @@ class WordJoinerGUI:
         self.hist.pack(padx=12, pady=(0,12))
 
         self.adjust_inputs()
+        self.root.after(POLL_MS, self.poll_results)
+
+    # =============================================================
+    # Worker results (runs on the Tk thread)
+    # =============================================================
+    def poll_results(self):
+        for channel, token, value, err in self.worker.results():
+            if channel == "engine":
+                self.status.config(text="Ready." if err is None else "Failed to load dictionaries.")
+                if err:
+                    messagebox.showerror("Engine", err)
+                continue
+            if not self.worker.is_current(channel, token):
+                continue   # superseded while it ran
+            if err:
+                self.status.config(text="Error.")
+                self.show_output(err)
+                continue
+            self.status.config(text="Ready.")
+            self.show_output(value)
+            # only the explicit request goes to history; live runs use their own channel
+            if channel == "process" and self._pending and self._pending[0] == token:
+                _, mode, w1, w2 = self._pending
+                self.hist.insert(tk.END, f"{mode}: {w1} {(w2 if w2 else '')} -> {value.splitlines()[0]}\n")
+                self._pending = None
+        self.root.after(POLL_MS, self.poll_results)
+
+    def show_output(self, text):
+        self.out.delete("1.0", tk.END)
+        self.out.insert(tk.END, text)
+
+    def _submit(self, channel, fn, *args):
+        if not self.worker.ready.is_set():
+            self.status.config(text="Loading dictionaries… (request queued)")
+        else:
+            self.status.config(text="Working…")
+        return self.worker.submit(channel, fn, *args)
+
+    def complete(self, prefix):
+        # read-only index lookup: safe to call here while the worker runs other jobs
+        wj = self.worker.engine
+        return wj.complete(prefix, COMPLETIONS) if wj else []
+
+    # =============================================================
+    # Live analysis (debounced)
+    # =============================================================
+    def schedule_live(self, event=None):
+        if self._live_after is not None:
+            self.root.after_cancel(self._live_after)
+            self._live_after = None
+        if self.live.get():
+            self._live_after = self.root.after(LIVE_DEBOUNCE_MS, self._run_live)
+
+    def _run_live(self):
+        self._live_after = None
+        mode = self.mode.get()
+        w1 = self.e1.get().strip()
+        w2 = self.e2.get().strip()
+        if self.input_missing(mode, w1, w2):
+            return
+        # a newer live submit makes older ones stale; explicit runs are not affected
+        self._submit("live", analyze, mode, w1, w2)
 
     # =============================================================
     # Input adjustment
@@ -111,89 +382,36 @@ class WordJoinerGUI:
     # =============================================================
     # PROCESS
     # =============================================================
+    @staticmethod
+    def input_missing(mode, w1, w2):
+        """Warning text when the mode's inputs are incomplete, else None."""
+        if mode == "sandhi" and (not w1 or not w2):
+            return "Enter both words"
+        if mode == "reverse_sandhi" and not w1:
+            return "Enter combined word"
+        if mode == "samasa" and not w1:
+            return "Enter compound word"
+        if mode == "vibhakti" and not w1:
+            return "Enter word"
+        return None
+
     def process(self):
         mode = self.mode.get()
         w1 = self.e1.get().strip()
         w2 = self.e2.get().strip()
 
-        # ---------------- SANDHI ----------------
-        if mode == "sandhi":
-            if not w1 or not w2:
-                messagebox.showwarning("Input", "Enter both words")
-                return
-            res = self.wj.apply_sandhi(w1, w2)
-            out_text = f"ಸಂಧಿ ಫಲಿತಾಂಶ:\n{res}"
-
-        # ---------------- REVERSE SANDHI ----------------
-        elif mode == "reverse_sandhi":
-            if not w1:
-                messagebox.showwarning("Input", "Enter combined word")
-                return
-
-            cands = self.wj.reverse_sandhi(w1)
-            if not cands:
-                out_text = "ಯಾವುದೇ ಸಂಧಿ ವಿಭಾಗ ಸಿಕ್ಕಿಲ್ಲ."
-            else:
-                lines = ["Reverse Sandhi candidates:\n"]
-                for i,(a,b) in enumerate(cands[:10], start=1):
-                    lines.append(f"{i}) ಪದ 1: {a}\n    ಪದ 2: {b}\n")
-                out_text = "\n".join(lines)
-
-        # ---------------- SAMĀSA ----------------
-        elif mode == "samasa":
-            if not w1:
-                messagebox.showwarning("Input", "Enter compound word")
-                return
-
-            sp = self.wj.validate_compound(w1)
-            if sp:
-                a,b = sp
-                out_text = f"ಸಮಾಸ ವಿಚ್ಛೇದ:\nಪದ 1: {a}\nಪದ 2: {b}"
-            else:
-                sugg = self.wj.get_suggestions(w1, 8)
-                if sugg:
-                    out_text = "ಸಮಾಸ ಸಿಕ್ಕಿಲ್ಲ.\nಸೂചനೆಗಳು:\n" + ", ".join(sugg)
-                else:
-                    out_text = "ಸಮಾಸ ಸಿಕ್ಕಿಲ್ಲ."
-
-        # ---------------- VIBHAKTI ----------------
-        elif mode == "vibhakti":
-            if not w1:
-                messagebox.showwarning("Input", "Enter word")
-                return
-
-            out, vid = self.wj.apply_vibhakti_single(w1)
-            det_id, _ = self.wj.detect_vibhakti(out)
-            final_id = vid or det_id or "unknown"
-
-            out_text = f"ವಿಭಕ್ತಿ ರೂಪ: {out}\nವಿಭಕ್ತಿ ಸಂಖ್ಯೆ: {final_id}"
-
-        else:
-            out_text = "Unknown mode."
-
-        # Show & Log
-        self.out.delete("1.0", tk.END)
-        self.out.insert(tk.END, out_text)
-
-        self.hist.insert(tk.END, f"{mode}: {w1} {(w2 if w2 else '')} -> {out_text.splitlines()[0]}\n")
+        warning = self.input_missing(mode, w1, w2)
+        if warning:
+            messagebox.showwarning("Input", warning)
+            return
+        self._pending = (self._submit("process", analyze, mode, w1, w2), mode, w1, w2)
 
     # =============================================================
     # OTHER BUTTONS
     # =============================================================
     def fuzzy_test(self):
-        lines = []
-
-        lines.append("Sandhi Test:\n" +
-                     self.wj.apply_sandhi("shakthi", "abhimaana"))
-
-        vb, _ = self.wj.apply_vibhakti_single("raama")
-        lines.append("\nVibhakti Test:\n" + vb)
-
-        sm = self.wj.validate_compound("ಲಕ್ಷ್ಮೀನಾರಾಯಣ")
-        lines.append("\nSamāsa Test:\n" + str(sm))
-
-        self.out.delete("1.0", tk.END)
-        self.out.insert(tk.END, "\n\n".join(lines))
+        self._pending = None
+        self._submit("process", fuzzy_test)
 
     def clear_all(self):
         self.e1.delete(0, tk.END)
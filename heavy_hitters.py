@@ -0,0 +1,93 @@
+# heavy_hitters.py
+# Space-Saving top-k counter (Metwally et al., 2005) with a fixed number of
+# slots, for counting word pairs over streams too large for an exact Counter.
+#
+# Every monitored key carries an estimate and an error: the true count lies in
+# [count - error, count], and error never exceeds total / capacity. Any key
+# whose true count is above total / capacity is guaranteed to be monitored.
+
+import heapq
+from typing import Dict, Hashable, Iterable, List, Mapping, Tuple
+
+
+class SpaceSaving:
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1: %r" % (capacity,))
+        self.capacity = capacity
+        self.total = 0                               # stream length (sum of all increments)
+        self._counts: Dict[Hashable, int] = {}
+        self._errors: Dict[Hashable, int] = {}
+        # min-heap of (count when pushed, key); entries go stale as counts grow
+        # and are refreshed lazily when they reach the top
+        self._heap: List[Tuple[int, Hashable]] = []
+
+    def __len__(self):
+        return len(self._counts)
+
+    def __contains__(self, key) -> bool:
+        return key in self._counts
+
+    def __getitem__(self, key) -> int:
+        return self._counts.get(key, 0)
+
+    def _pop_min(self) -> Tuple[int, Hashable]:
+        heap, counts = self._heap, self._counts
+        while True:
+            c, key = heap[0]
+            actual = counts[key]
+            if c == actual:
+                return heapq.heappop(heap)
+            heapq.heapreplace(heap, (actual, key))
+
+    def add(self, key, n: int = 1):
+        self.total += n
+        counts = self._counts
+        if key in counts:
+            counts[key] += n
+        elif len(counts) < self.capacity:
+            counts[key] = n
+            self._errors[key] = 0
+            heapq.heappush(self._heap, (n, key))
+        else:
+            floor, evicted = self._pop_min()
+            del counts[evicted]
+            del self._errors[evicted]
+            counts[key] = floor + n
+            self._errors[key] = floor
+            heapq.heappush(self._heap, (floor + n, key))
+
+    def update(self, items: Mapping[Hashable, int]):
+        """Add counts from a mapping (e.g. one page's Counter)."""
+        for key, n in items.items():
+            self.add(key, n)
+
+    def add_all(self, keys: Iterable[Hashable]):
+        for key in keys:
+            self.add(key)
+
+    def error(self, key) -> int:
+        return self._errors.get(key, 0)
+
+    def max_error(self) -> int:
+        """Upper bound on every estimate's overcount (the smallest monitored count once full)."""
+        if len(self._counts) < self.capacity:
+            return 0
+        return min(self._counts.values())
+
+    def most_common(self, n: int = None) -> List[Tuple[Hashable, int]]:
+        """(key, estimated count) pairs, largest first, like Counter.most_common."""
+        if n is None:
+            return sorted(self._counts.items(), key=lambda kv: kv[1], reverse=True)
+        return heapq.nlargest(n, self._counts.items(), key=lambda kv: kv[1])
+
+    def top_k(self, n: int) -> List[Tuple[Hashable, int, int, bool]]:
+        """
+        (key, estimated count, error, guaranteed) for the n largest estimates.
+        `guaranteed` means the key is certainly among the true top n: its lower
+        bound (count - error) is at least every other key's upper bound.
+        """
+        ranked = self.most_common(n + 1)
+        # an unmonitored key may have a true count up to max_error()
+        nxt = max(ranked[n][1] if len(ranked) > n else 0, self.max_error())
+        return [(key, c, self._errors[key], c - self._errors[key] >= nxt) for key, c in ranked[:n]]
@@ -1,14 +1,87 @@
 # hint_generator.py
-import pandas as pd
+# Compound hints for a first word. The CSV is read once into two indexes:
+# an exact word1 -> rows map, and a character n-gram index over word1 for the
+# substring fallback. Both return rows ordered by the `frequency` column
+# (high, medium, low, then anything else), CSV order within a frequency.
+# pandas is not needed; it is only imported if the `df` attribute is used.
+
+import csv
+from collections import defaultdict
+from typing import Dict, List
+
+_FREQ_RANK = {"high": 0, "medium": 1, "low": 2}
+_MAX_GRAM = 3   # substring queries shorter than this are looked up directly
+
+
+def _freq_rank(value: str) -> int:
+    return _FREQ_RANK.get((value or "").strip().lower(), len(_FREQ_RANK))
+
 
 class HintGenerator:
     def __init__(self, compound_csv="../dictionaries/compound_words.csv"):
-        self.df = pd.read_csv(compound_csv, dtype=str).fillna('')
+        self.compound_csv = compound_csv
+        with open(compound_csv, encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            self.columns = list(reader.fieldnames or [])
+            rows = [{k: (v or "") for k, v in r.items() if k is not None} for r in reader]
+        self._df = None
+
+        # rows sharing (word1, frequency rank) form one group; groups are kept
+        # in hint order, so walking group ids in ascending order is already
+        # frequency-then-CSV order
+        groups: Dict[tuple, List[dict]] = {}
+        for r in rows:
+            groups.setdefault((r.get("word1", ""), _freq_rank(r.get("frequency", ""))), []).append(r)
+        ordered = sorted(groups.items(), key=lambda kv: kv[0][1])   # stable: first-seen within a rank
+        self._group_word = [word for (word, _), _ in ordered]
+        self._group_rows = [grp for _, grp in ordered]
+
+        self._exact: Dict[str, List[dict]] = defaultdict(list)
+        grams: Dict[str, List[int]] = defaultdict(list)
+        for gid, word in enumerate(self._group_word):
+            self._exact[word].extend(self._group_rows[gid])
+            seen = set()
+            for n in range(1, _MAX_GRAM + 1):
+                for i in range(len(word) - n + 1):
+                    g = word[i:i + n]
+                    if g not in seen:
+                        seen.add(g)
+                        grams[g].append(gid)
+        self._exact = dict(self._exact)
+        self._grams = dict(grams)
+        self.size = len(rows)
+
+    @property
+    def df(self):
+        """The rows as a pandas DataFrame (built on first access; needs pandas)."""
+        if self._df is None:
+            import pandas as pd
+            self._df = pd.read_csv(self.compound_csv, dtype=str).fillna('')
+        return self._df
+
+    def _substring_groups(self, word1: str):
+        """Group ids whose word1 contains `word1`, in hint order."""
+        if not word1:
+            return range(len(self._group_word))
+        if len(word1) <= _MAX_GRAM:
+            return self._grams.get(word1, ())
+        # every match contains all of the query's n-grams; walk the rarest one
+        postings = []
+        for i in range(len(word1) - _MAX_GRAM + 1):
+            p = self._grams.get(word1[i:i + _MAX_GRAM])
+            if p is None:
+                return ()
+            postings.append(p)
+        words = self._group_word
+        return (gid for gid in min(postings, key=len) if word1 in words[gid])
 
     def hints_for(self, word1, limit=5):
-        df = self.df[self.df['word1']==word1]
-        if df.empty:
+        rows = self._exact.get(word1)
+        if rows is None:
             # fallback: any compound where word1 is a substring
-            df = self.df[self.df['word1'].str.contains(word1, na=False)]
-        df = df.head(limit)
-        return df.to_dict('records')
+            rows = []
+            for gid in self._substring_groups(word1):
+                rows.extend(self._group_rows[gid])
+                if len(rows) >= limit:
+                    break
+        return [dict(r) for r in rows[:limit]]
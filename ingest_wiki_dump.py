@@ -0,0 +1,195 @@
+# ingest_wiki_dump.py
+# Build root_words.csv and compound_words.csv in one offline pass over a
+# Wikipedia pages-articles dump (e.g. knwiki-latest-pages-articles.xml.bz2).
+#
+# The main process decompresses the dump and walks it with an incremental XML
+# parser, keeping only article pages (ns 0, no redirects). Their wikitext is
+# sent in chunks to a process pool, where markup is stripped and the text is
+# tokenized exactly as the API scrapers do. Chunk results are merged in dump
+# order, so output is deterministic for a given dump.
+#
+#   python ingest_wiki_dump.py knwiki-latest-pages-articles.xml.bz2 --workers 8
+#   python ingest_wiki_dump.py dump.xml.bz2 --roots 0 --compounds 10000 --capacity 200000
+
+import argparse, bz2, gzip, os, re, time
+import xml.etree.ElementTree as ET
+from collections import Counter
+from typing import Iterator, List, Optional, Tuple
+
+from code.scrape_wikipedia_roots import (tokenize_kannada_text, normalize_word, is_root_candidate,
+                                         FIELDNAMES, output_row)
+from code.extract_compounds_from_wiki import tokenize, write_compounds
+from code.heavy_hitters import SpaceSaving
+from code.scrape_checkpoint import CsvAppender
+from code.parallel import parallel_map
+
+
+# ---------- dump reading ----------
+def _open_dump(path: str):
+    if path.endswith(".bz2"):
+        return bz2.open(path, "rb")
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def iter_articles(path: str) -> Iterator[Tuple[str, str]]:
+    """(title, wikitext) of every ns-0, non-redirect page, streaming."""
+    with _open_dump(path) as f:
+        context = ET.iterparse(f, events=("start", "end"))
+        _, root = next(context)
+        title = ns = text = None
+        redirect = False
+        for event, elem in context:
+            if event != "end":
+                continue
+            tag = _local(elem.tag)
+            if tag == "title":
+                title = elem.text or ""
+            elif tag == "ns":
+                ns = (elem.text or "").strip()
+            elif tag == "redirect":
+                redirect = True
+            elif tag == "text":
+                text = elem.text or ""
+            elif tag == "page":
+                if ns == "0" and not redirect and text:
+                    yield title, text
+                title = ns = text = None
+                redirect = False
+                root.clear()   # drop finished pages so memory stays flat
+
+
+# ---------- markup stripping ----------
+_COMMENT = re.compile(r"<!--.*?-->", re.S)
+_REF = re.compile(r"<ref[^>/]*/>|<ref[^>]*>.*?</ref>", re.S | re.I)
+_DROP_TAGS = re.compile(r"<(math|gallery|timeline|syntaxhighlight|source|score)[^>]*>.*?</\1>", re.S | re.I)
+_TEMPLATE = re.compile(r"\{\{[^{}]*\}\}")
+_TABLE = re.compile(r"\{\|(?:(?!\{\|).)*?\|\}", re.S)
+_LINK = re.compile(r"\[\[([^\[\]|]*)(?:\|([^\[\]]*))?\]\]")
+_EXTLINK = re.compile(r"\[(?:https?:)?//[^\s\]]+\s*([^\]]*)\]")
+_TAG = re.compile(r"</?[a-zA-Z][^>]*>")
+_FORMAT = re.compile(r"'{2,}|^=+|=+\s*$|^[*#:;]+", re.M)
+
+
+def _link_text(m) -> str:
+    target, label = m.group(1), m.group(2)
+    # [[File:..]], [[Category:..]], [[ಚಿತ್ರ:..]], [[ವರ್ಗ:..]], interwiki: no article text
+    if ":" in target.lstrip(":"):
+        return ""
+    return target if label is None else label
+
+
+def _strip_nested(pattern, text: str, repl="") -> str:
+    while True:
+        text, n = pattern.subn(repl, text)
+        if not n:
+            return text
+
+
+def strip_markup(wikitext: str) -> str:
+    """Reduce wikitext to roughly its plain prose (enough for Kannada tokenization)."""
+    text = _COMMENT.sub("", wikitext)
+    text = _REF.sub("", text)
+    text = _DROP_TAGS.sub("", text)
+    text = _strip_nested(_TEMPLATE, text)
+    text = _strip_nested(_TABLE, text)
+    text = _strip_nested(_LINK, text, _link_text)   # innermost first: captions before their files
+    text = _EXTLINK.sub(r"\1", text)
+    text = _TAG.sub("", text)
+    return _FORMAT.sub("", text)
+
+
+# ---------- worker ----------
+def analyze_chunk(texts: List[str]) -> Tuple[List[str], Counter]:
+    """Root candidates (first-seen order) and adjacent-pair counts for a chunk of pages."""
+    words = {}
+    pairs = Counter()
+    for wikitext in texts:
+        plain = strip_markup(wikitext)
+        for tok in tokenize_kannada_text(plain):
+            tok = normalize_word(tok)
+            if is_root_candidate(tok):
+                words.setdefault(tok, None)
+        toks = tokenize(plain)
+        for w1, w2 in zip(toks, toks[1:]):
+            if len(w1) >= 2 and len(w2) >= 2:
+                pairs[(w1, w2)] += 1
+    return list(words), pairs
+
+
+def _analyze_counted(chunk: List[str]) -> Tuple[int, List[str], Counter]:
+    return (len(chunk),) + analyze_chunk(chunk)
+
+
+def _chunks(path: str, pages_per_chunk: int, max_pages: int) -> Iterator[List[str]]:
+    chunk = []
+    for i, (_, text) in enumerate(iter_articles(path)):
+        if max_pages and i >= max_pages:
+            break
+        chunk.append(text)
+        if len(chunk) >= pages_per_chunk:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def analyze_dump(dump: str, workers: Optional[int] = None, pages_per_chunk: int = 200,
+                 max_pages: int = 0) -> Iterator[Tuple[int, List[str], Counter]]:
+    """Yield (pages, root candidates, pair counts) per chunk, in dump order (see parallel_map)."""
+    return parallel_map(_analyze_counted, _chunks(dump, pages_per_chunk, max_pages), workers)
+
+
+def main(dump, roots_out="../dictionaries/root_words.csv", compounds_out="../dictionaries/compound_words.csv",
+         roots=0, compounds=2500, capacity=0, workers=None, pages_per_chunk=200, max_pages=0,
+         overwrite=False):
+    pairs = SpaceSaving(max(capacity, compounds)) if capacity else Counter()
+    seen = set()
+    pages = 0
+    report_every = pages_per_chunk * 50
+    t0 = time.perf_counter()
+
+    # roots go to disk as they are found; compounds are ranked at the end
+    if not overwrite and os.path.exists(compounds_out) and os.path.getsize(compounds_out) > 0:
+        raise FileExistsError(f"{compounds_out} already has data")
+    with CsvAppender(roots_out, FIELDNAMES, overwrite=overwrite) as out:
+        for n, words, chunk_pairs in analyze_dump(dump, workers, pages_per_chunk, max_pages):
+            for w in words:
+                if w not in seen and (not roots or len(seen) < roots):
+                    seen.add(w)
+                    out.writerow(output_row(w, {"word": w, "last_sound": w[-1]}))
+            pairs.update(chunk_pairs)
+            if (pages + n) // report_every > pages // report_every:
+                print(f"  {pages + n} pages, {len(seen)} roots, {len(pairs)} pairs tracked,"
+                      f" {(pages + n) / (time.perf_counter() - t0):.0f} pages/s")
+            pages += n
+
+    print(f"\n✔ Successfully wrote {len(seen)} words to {roots_out} ({pages} articles)")
+    write_compounds(pairs, compounds, compounds_out)
+    print(f"Done in {time.perf_counter() - t0:.1f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("dump", help="pages-articles dump (.xml, .xml.bz2 or .xml.gz)")
+    parser.add_argument("--roots-out", type=str, default="../dictionaries/root_words.csv")
+    parser.add_argument("--compounds-out", type=str, default="../dictionaries/compound_words.csv")
+    parser.add_argument("--roots", type=int, default=0, help="max root words (0: all)")
+    parser.add_argument("--compounds", type=int, default=2500, help="top pairs to keep")
+    parser.add_argument("--capacity", type=int, default=0,
+                        help="count pairs in a fixed-size Space-Saving sketch of this many slots (0: exact)")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (default: all cores)")
+    parser.add_argument("--pages-per-chunk", type=int, default=200)
+    parser.add_argument("--max-pages", type=int, default=0, help="stop after this many articles (0: all)")
+    parser.add_argument("--overwrite", action="store_true", help="replace existing non-empty output files")
+    args = parser.parse_args()
+    try:
+        main(args.dump, args.roots_out, args.compounds_out, args.roots, args.compounds, args.capacity,
+             args.workers, args.pages_per_chunk, args.max_pages, args.overwrite)
+    except FileExistsError as e:
+        parser.error(f"{e}; pass --overwrite to replace it")
@@ -0,0 +1,65 @@
+# lru_cache.py
+# Bounded LRU cache with hit/miss/eviction counters (used by WordJoiner).
+# One lock serializes every read and write of the OrderedDict and the counters.
+# Lookup and store are separate calls, so two threads missing on the same key
+# both compute the value and the later put wins; callers must only cache pure
+# results for that to be harmless. maxsize 0 stores nothing but still counts misses.
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+
+_MISSING = object()
+
+
+class LRUCache:
+    def __init__(self, maxsize: int):
+        self.maxsize = max(0, int(maxsize))
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (found, value) and mark the key as most recently used."""
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries; counters are kept so traffic stats survive invalidation."""
+        with self._lock:
+            self._data.clear()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
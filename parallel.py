@@ -0,0 +1,77 @@
+# parallel.py
+# Ordered, bounded fan-out over a process pool for the batch tools
+# (corpus_analyzer, ingest_wiki_dump, run_tests, generate_test_cases).
+#
+# parallel_map(fn, tasks, workers) yields fn(task) in task order. Tasks are
+# pulled lazily and at most INFLIGHT_PER_WORKER per worker are submitted
+# ahead of the result being consumed, so a huge task stream never piles up
+# in memory. workers=1 runs in-process, without a pool.
+#
+# Pool workers that need a WordJoiner build one at start-up with
+# init_worker_engine (the pool initializer) and fetch it with worker_engine().
+
+import contextlib, os
+from collections import deque
+from multiprocessing import Pool
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+from code.word_joiner import WordJoiner
+
+INFLIGHT_PER_WORKER = 4
+
+_engine: Optional[WordJoiner] = None   # this process's engine
+
+
+def init_worker_engine(cache_sizes: Optional[Dict[str, int]] = None):
+    global _engine
+    _engine = WordJoiner(cache_sizes=cache_sizes)
+
+
+def worker_engine() -> WordJoiner:
+    """The engine built by init_worker_engine (built with defaults on first use otherwise)."""
+    if _engine is None:
+        init_worker_engine()
+    return _engine
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    return workers or os.cpu_count() or 1
+
+
+@contextlib.contextmanager
+def worker_pool(workers: Optional[int] = None, initializer: Optional[Callable] = None, initargs: tuple = ()):
+    """
+    A Pool of `workers` processes, or None when workers == 1 (the
+    initializer then runs in this process). Use with imap_ordered.
+    """
+    workers = resolve_workers(workers)
+    if workers == 1:
+        if initializer:
+            initializer(*initargs)
+        yield None
+        return
+    with Pool(workers, initializer=initializer, initargs=initargs) as pool:
+        yield pool
+
+
+def imap_ordered(pool, fn: Callable, tasks: Iterable, max_inflight: int) -> Iterator:
+    """fn(task) for every task, in order, with at most max_inflight submitted ahead (pool=None: in-process)."""
+    if pool is None:
+        for task in tasks:
+            yield fn(task)
+        return
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.apply_async(fn, (task,)))
+        while len(pending) >= max_inflight:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def parallel_map(fn: Callable, tasks: Iterable, workers: Optional[int] = None,
+                 initializer: Optional[Callable] = None, initargs: tuple = ()) -> Iterator:
+    """fn(task) for every task, in task order, on a bounded pool of `workers` processes."""
+    workers = resolve_workers(workers)
+    with worker_pool(workers, initializer, initargs) as pool:
+        yield from imap_ordered(pool, fn, tasks, workers * INFLIGHT_PER_WORKER)
@@ -0,0 +1,63 @@
+# prefix_trie.py
+# Character trie for dictionary membership and prefix checks in O(len(word)).
+
+from typing import Iterable, Optional
+
+_END = ""   # terminal marker key inside a node dict (never a real character; survives pickling)
+
+
+class PrefixTrie:
+    """
+    Nested-dict character trie.
+    Answers "is a word", "is a prefix of some word" and
+    "has some word as a prefix" without scanning the word list.
+    """
+    def __init__(self, words: Iterable[str] = ()):
+        self._root = {}
+        self._size = 0
+        for w in words:
+            self.add(w)
+
+    def add(self, word: str) -> None:
+        node = self._root
+        for ch in word:
+            node = node.setdefault(ch, {})
+        if _END not in node:
+            node[_END] = True
+            self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, word: str) -> bool:
+        node = self._find(word)
+        return node is not None and _END in node
+
+    def _find(self, prefix: str) -> Optional[dict]:
+        node = self._root
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def is_prefix(self, prefix: str) -> bool:
+        """True if some stored word starts with `prefix` (including equality)."""
+        return self._find(prefix) is not None
+
+    def longest_prefix_of(self, word: str) -> Optional[str]:
+        """Longest stored word that `word` starts with, or None."""
+        node = self._root
+        best = "" if _END in node else None
+        for i, ch in enumerate(word):
+            node = node.get(ch)
+            if node is None:
+                break
+            if _END in node:
+                best = word[:i+1]
+        return best
+
+    def has_prefix_of(self, word: str) -> bool:
+        """True if `word` starts with some stored word (including equality)."""
+        return self.longest_prefix_of(word) is not None
+
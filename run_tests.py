@@ -1,36 +1,232 @@
 # run_tests.py
-import pandas as pd
-from word_joiner import WordJoiner
-import csv, os
-
-def main(test_csv="../test_cases/word_pairs_test.csv"):
-    wj = WordJoiner()
-    tests = pd.read_csv(test_csv, dtype=str).fillna('')
-    total = len(tests)
-    correct = 0
-    failures = []
-    for _, row in tests.iterrows():
-        w1 = row['word1']
-        w2 = row['word2']
-        expected = row['expected_result']
-        combined, rule = wj.apply_sandhi(w1, w2)
-        is_ok = (combined == expected)
-        if is_ok:
-            correct += 1
+# Evaluation harness over word_pairs_test.csv. The file is streamed in shards
+# that are spread over a process pool (one warm WordJoiner per worker); every
+# row is checked in each mode:
+#   sandhi   apply_sandhi(word1, word2) == expected_result
+#   reverse  (word1, word2) among reverse_sandhi(expected_result)  (top1 also reported)
+#   samasa   validate_compound(expected_result) == (word1, word2) for valid compounds,
+#            and None for rows marked is_valid_compound=no
+#   vibhakti word1 is inflected with one of the case endings in vibhakti_rules.csv
+#            (picked per row from its test_id) via apply_vibhakti, and
+#            detect_vibhakti must return that ending's case (ENDING_CASE)
+# Per-row results are appended to test_results/results.csv shard by shard (in
+# input order), failures to test_results/failures.csv, and accuracy with
+# per-call latency (mean and percentiles) to test_results/summary.json.
+#
+#   python run_tests.py ../test_cases/word_pairs_test.csv --workers 8 --modes sandhi reverse
+
+import argparse, csv, json, math, os, time, zlib
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from code.word_joiner import WordJoiner
+from code.parallel import parallel_map, init_worker_engine, worker_engine, resolve_workers
+
+MODES = ["sandhi", "reverse", "samasa", "vibhakti"]
+
+# grammatical case marked by each vibhakti_rules.csv ending (the CSV's own
+# vibhakti_id column numbers rows, not cases); endings not listed here, such
+# as the plural ಗಳು/ಗಳ, are not used for test cases
+ENDING_CASE = {
+    "ಅನ್ನು": "2", "ರನ್ನು": "2", "ಯನ್ನು": "2",
+    "ಇಂದ": "3", "ದಿಂದ": "3",
+    "ಗೆ": "4", "ಕ್ಕೆ": "4",
+    "ಅಲ್ಲಿ": "7", "ದಲ್ಲಿ": "7",
+}
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram (~2% resolution), mergeable across shards in fixed memory."""
+    STEPS = 50   # buckets per factor of e
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total_s = 0.0
+
+    def add(self, seconds: float):
+        us = max(seconds * 1e6, 1e-3)
+        b = int(math.log(us) * self.STEPS)
+        self.buckets[b] = self.buckets.get(b, 0) + 1
+        self.count += 1
+        self.total_s += seconds
+
+    def merge(self, other: "LatencyHistogram"):
+        for b, c in other.buckets.items():
+            self.buckets[b] = self.buckets.get(b, 0) + c
+        self.count += other.count
+        self.total_s += other.total_s
+
+    def percentile(self, q: float) -> float:
+        """Approximate q-th percentile in microseconds."""
+        if not self.count:
+            return 0.0
+        rank = q / 100.0 * (self.count - 1)
+        seen = 0
+        for b in sorted(self.buckets):
+            seen += self.buckets[b]
+            if seen > rank:
+                return math.exp((b + 0.5) / self.STEPS)
+        return math.exp((max(self.buckets) + 0.5) / self.STEPS)
+
+
+def _timed(fn, *args):
+    t0 = time.perf_counter()
+    res = fn(*args)
+    return res, time.perf_counter() - t0
+
+
+def case_endings(wj: WordJoiner) -> List[str]:
+    """Distinct vibhakti_rules.csv endings with a known case, in CSV order."""
+    endings = (r.get("ending", "") for r in wj.vibhakti_rules_csv)
+    return [e for e in dict.fromkeys(endings) if e in ENDING_CASE]
+
+
+def evaluate_row(wj: WordJoiner, row: Dict[str, str], modes: List[str],
+                 hist: Dict[str, LatencyHistogram], endings: Optional[List[str]] = None) -> Dict[str, object]:
+    """One output row: the inputs plus got/ok columns for every mode."""
+    w1, w2 = row.get("word1", ""), row.get("word2", "")
+    expected = row.get("expected_result", "")
+    valid = (row.get("is_valid_compound", "yes") or "yes").strip().lower() == "yes"
+    out: Dict[str, object] = {"test_id": row.get("test_id", ""), "word1": w1, "word2": w2,
+                              "expected": expected}
+    if "sandhi" in modes:
+        got, dt = _timed(wj.apply_sandhi, w1, w2)
+        hist["sandhi"].add(dt)
+        out["sandhi_got"], out["sandhi_ok"] = got, got == expected
+    if "reverse" in modes:
+        cands, dt = _timed(wj.reverse_sandhi, expected)
+        hist["reverse"].add(dt)
+        out["reverse_got"] = "+".join(cands[0]) if cands else ""
+        out["reverse_ok"] = (w1, w2) in cands
+        out["reverse_top1"] = bool(cands) and cands[0] == (w1, w2)
+    if "samasa" in modes:
+        split, dt = _timed(wj.validate_compound, expected)
+        hist["samasa"].add(dt)
+        out["samasa_got"] = "+".join(split) if split else ""
+        out["samasa_ok"] = (split == (w1, w2)) if valid else split is None
+    if "vibhakti" in modes:
+        endings = endings if endings is not None else case_endings(wj)
+        if not endings or not w1:
+            out["vibhakti_got"], out["vibhakti_ok"] = "", None   # nothing to score
         else:
-            failures.append({
-                "word1":w1, "word2":w2, "expected":expected, "got":combined, "rule":rule
-            })
-    acc = correct/total*100
-    print(f"Total: {total}, Correct: {correct}, Accuracy: {acc:.2f}%")
-    os.makedirs("test_results", exist_ok=True)
-    with open("test_results/failures.csv","w",encoding="utf-8",newline="") as f:
-        fieldnames = ["word1","word2","expected","got","rule"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in failures:
-            writer.writerow(r)
-    print(f"Wrote {len(failures)} failures to test_results/failures.csv")
+            # the same row always gets the same ending, however it is sharded
+            ending = endings[zlib.crc32(f"{out['test_id']}|{w1}".encode("utf-8")) % len(endings)]
+            t0 = time.perf_counter()
+            inflected, _ = wj.apply_vibhakti(w1, ending)
+            detected, _ = wj.detect_vibhakti(inflected)
+            hist["vibhakti"].add(time.perf_counter() - t0)
+            out["vibhakti_got"] = f"{ending}:{inflected}:{detected or ''}"
+            out["vibhakti_ok"] = detected == ENDING_CASE[ending]
+    return out
+
+
+def evaluate_shard(task: Tuple[List[Dict[str, str]], List[str]]):
+    """Returns (result rows, per-mode [correct, scored, extra] counts, per-mode histograms)."""
+    rows, modes = task
+    wj = worker_engine()
+    hist = {m: LatencyHistogram() for m in modes}
+    counts = {m: [0, 0, 0] for m in modes}
+    endings = case_endings(wj) if "vibhakti" in modes else None
+    results = []
+    for row in rows:
+        res = evaluate_row(wj, row, modes, hist, endings)
+        for m in modes:
+            ok = res[f"{m}_ok"]
+            if ok is None:
+                continue
+            counts[m][0] += bool(ok)
+            counts[m][1] += 1
+            if m == "reverse":
+                counts[m][2] += bool(res["reverse_top1"])
+        results.append(res)
+    return results, counts, hist
+
+
+def iter_shards(test_csv: str, shard_size: int) -> Iterator[List[Dict[str, str]]]:
+    with open(test_csv, encoding="utf-8", newline="") as f:
+        shard = []
+        for row in csv.DictReader(f):
+            shard.append(row)
+            if len(shard) >= shard_size:
+                yield shard
+                shard = []
+        if shard:
+            yield shard
+
+
+def evaluate(test_csv: str, modes: List[str], workers: Optional[int] = None,
+             shard_size: int = 2000) -> Iterator[tuple]:
+    """Yield evaluate_shard results in input order (see parallel_map)."""
+    shards = ((rows, modes) for rows in iter_shards(test_csv, shard_size))
+    return parallel_map(evaluate_shard, shards, workers, init_worker_engine)
+
+
+def main(test_csv="../test_cases/word_pairs_test.csv", modes=None, workers=None, shard_size=2000,
+         out_dir="test_results"):
+    modes = modes or MODES
+    os.makedirs(out_dir, exist_ok=True)
+    fieldnames = ["test_id", "word1", "word2", "expected"]
+    for m in modes:
+        fieldnames += [f"{m}_got", f"{m}_ok"] + (["reverse_top1"] if m == "reverse" else [])
+
+    counts = {m: [0, 0, 0] for m in modes}
+    hist = {m: LatencyHistogram() for m in modes}
+    total = failed = 0
+    t0 = time.perf_counter()
+    with open(os.path.join(out_dir, "results.csv"), "w", encoding="utf-8", newline="") as rf, \
+         open(os.path.join(out_dir, "failures.csv"), "w", encoding="utf-8", newline="") as ff:
+        results_w = csv.DictWriter(rf, fieldnames=fieldnames)
+        failures_w = csv.DictWriter(ff, fieldnames=fieldnames)
+        results_w.writeheader()
+        failures_w.writeheader()
+        for rows, shard_counts, shard_hist in evaluate(test_csv, modes, workers, shard_size):
+            for r in rows:
+                results_w.writerow(r)
+                if any(r[f"{m}_ok"] is False for m in modes):
+                    failures_w.writerow(r)
+                    failed += 1
+            total += len(rows)
+            for m in modes:
+                for i in range(3):
+                    counts[m][i] += shard_counts[m][i]
+                hist[m].merge(shard_hist[m])
+            rf.flush()
+            ff.flush()
+    wall = time.perf_counter() - t0
+
+    summary = {"test_file": test_csv, "rows": total, "rows_with_failures": failed,
+               "workers": resolve_workers(workers), "wall_s": round(wall, 3),
+               "rows_per_s": round(total / wall, 1) if wall else 0.0, "modes": {}}
+    print(f"Total rows: {total} in {wall:.2f}s ({summary['rows_per_s']} rows/s)")
+    for m in modes:
+        correct, scored, top1 = counts[m]
+        h = hist[m]
+        s = {
+            "scored": scored,
+            "correct": correct,
+            "accuracy": round(correct / scored * 100, 2) if scored else None,
+            # per-call time inside one worker; overall throughput is rows_per_s
+            "latency_us": {"mean": round(h.total_s / h.count * 1e6, 2) if h.count else 0.0,
+                           **{q: round(h.percentile(p), 2) for q, p in (("p50", 50), ("p95", 95), ("p99", 99))}},
+        }
+        if m == "reverse":
+            s["top1_accuracy"] = round(top1 / scored * 100, 2) if scored else None
+        summary["modes"][m] = s
+        acc = f"{s['accuracy']:.2f}%" if scored else "n/a"
+        lat = s["latency_us"]
+        print(f"  {m:<9} accuracy {acc:>8} ({correct}/{scored})  mean {lat['mean']:.1f}us"
+              f"  p50 {lat['p50']:.1f}us  p95 {lat['p95']:.1f}us  p99 {lat['p99']:.1f}us")
+    with open(os.path.join(out_dir, "summary.json"), "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    print(f"Wrote {failed} failing rows to {out_dir}/failures.csv, summary to {out_dir}/summary.json")
+    return summary
 
 if __name__=="__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("test_csv", nargs="?", default="../test_cases/word_pairs_test.csv")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=None, help="default: all")
+    parser.add_argument("--workers", type=int, default=None, help="process count (default: all cores)")
+    parser.add_argument("--shard-size", type=int, default=2000, help="rows per pool task")
+    parser.add_argument("--out-dir", type=str, default="test_results")
+    args = parser.parse_args()
+    main(args.test_csv, args.modes, args.workers, args.shard_size, args.out_dir)
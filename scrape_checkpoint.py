@@ -0,0 +1,152 @@
+# scrape_checkpoint.py
+# Append-only, periodically flushed CSV output for the wiki scrapers, so an
+# interrupted run keeps everything written so far and can be resumed.
+#
+# Each scraper writes its results through a CsvAppender and logs every page it
+# has finished in a ProcessedTitles file next to the output (<out>.titles.csv).
+# With --resume both files are reopened for appending: results already on disk
+# are read back to rebuild the scraper's state, and logged titles are skipped.
+# Without it an existing non-empty file is only replaced when --overwrite is
+# given, so a plain rerun cannot wipe a finished dictionary.
+
+import csv, os, time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+
+def titles_log_path(outpath: str) -> str:
+    return outpath + ".titles.csv"
+
+
+def _drop_partial_line(path: str):
+    """Cut a trailing unterminated line (a write interrupted by a crash)."""
+    with open(path, "rb+") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+        block, pos = 4096, size
+        while pos > 0:
+            start = max(0, pos - block)
+            f.seek(start)
+            chunk = f.read(pos - start)
+            nl = chunk.rfind(b"\n")
+            if nl >= 0:
+                f.truncate(start + nl + 1)
+                return
+            pos = start
+        f.truncate(0)
+
+
+def read_rows(path: str) -> Iterator[Dict[str, str]]:
+    """
+    Rows of an existing output CSV (nothing if it does not exist). A trailing
+    partial row left by a crash is cut from the file first.
+    """
+    if not os.path.exists(path):
+        return
+    _drop_partial_line(path)
+    with open(path, encoding="utf-8", newline="") as f:
+        yield from csv.DictReader(f)
+
+
+class CsvAppender:
+    """
+    CSV writer that appends to `path` (resume) or starts it fresh, flushing and
+    fsyncing every `flush_every` rows or `flush_secs` seconds, and on close().
+    Starting fresh over a non-empty file raises FileExistsError unless
+    `overwrite` is set. `before_flush` runs first on every flush (used to make
+    results durable before the titles that produced them are logged).
+    """
+    def __init__(self, path: str, fieldnames: List[str], resume: bool = False,
+                 flush_every: int = 100, flush_secs: float = 5.0,
+                 before_flush: Optional[Callable[[], None]] = None, overwrite: bool = False):
+        out_dir = os.path.dirname(path)
+        if out_dir:
+            os.makedirs(out_dir, exist_ok=True)
+        self.path = path
+        self.fieldnames = fieldnames
+        self.flush_every = max(1, flush_every)
+        self.flush_secs = flush_secs
+        self.before_flush = before_flush
+        has_data = os.path.exists(path) and os.path.getsize(path) > 0
+        if has_data and not (resume or overwrite):
+            raise FileExistsError(f"{path} already has data")
+        appending = resume and has_data
+        if appending:
+            _drop_partial_line(path)
+            appending = os.path.getsize(path) > 0
+        self._f = open(path, "a" if appending else "w", encoding="utf-8", newline="")
+        self._writer = csv.DictWriter(self._f, fieldnames=fieldnames, extrasaction="ignore")
+        if not appending:
+            self._writer.writeheader()
+        self.written = 0
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def writerow(self, row: Dict[str, object]):
+        self._writer.writerow(row)
+        self.written += 1
+        self._pending += 1
+        if self._pending >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_secs:
+            self.flush()
+
+    def writerows(self, rows: Iterable[Dict[str, object]]):
+        for r in rows:
+            self.writerow(r)
+
+    def flush(self):
+        if self.before_flush:
+            self.before_flush()
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        if not self._f.closed:
+            self.flush()
+            self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ProcessedTitles:
+    """
+    Set of finished page titles, persisted through a CsvAppender. Pass the
+    scraper's result appender as `results` so it is flushed before the log.
+    """
+    def __init__(self, path: str, resume: bool = False, flush_every: int = 20,
+                 results: Optional[CsvAppender] = None, overwrite: bool = False):
+        self.done = {r["title"] for r in read_rows(path)} if resume else set()
+        self._log = CsvAppender(path, ["title"], resume, flush_every,
+                                before_flush=results.flush if results else None, overwrite=overwrite)
+
+    def __contains__(self, title: str) -> bool:
+        return title in self.done
+
+    def __len__(self):
+        return len(self.done)
+
+    def add(self, title: str):
+        if title not in self.done:
+            self.done.add(title)
+            self._log.writerow({"title": title})
+
+    def flush(self):
+        self._log.flush()
+
+    def close(self):
+        self._log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
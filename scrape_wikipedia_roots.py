@@ -1,35 +1,10 @@
 # scrape_wikipedia_roots.py
 
-import requests, time, csv, argparse, re, os
+import csv, argparse, re
 from tqdm import tqdm
-from collections import OrderedDict
-
-API = "https://kn.wikipedia.org/w/api.php"
-HEADERS = {"User-Agent": "WordBuilderBot/1.0 (contact: you@example.com)"}
-
-def get_random_pages(n=50):
-    params = {
-        "action": "query",
-        "list": "random",
-        "rnlimit": n,
-        "rnnamespace": 0,
-        "format": "json"
-    }
-    r = requests.get(API, params=params, headers=HEADERS, timeout=20).json()
-    return [p['title'] for p in r['query']['random']]
-
-def get_page_text(title):
-    params = {
-        "action": "query",
-        "prop": "extracts",
-        "explaintext": "1",
-        "titles": title,
-        "format": "json"
-    }
-    r = requests.get(API, params=params, headers=HEADERS, timeout=20).json()
-    pages = r['query']['pages']
-    page = next(iter(pages.values()))
-    return page.get('extract', '')
+
+from code.wiki_fetcher import WikiFetcher, API, HEADERS
+from code.scrape_checkpoint import CsvAppender, ProcessedTitles, read_rows, titles_log_path
 
 def tokenize_kannada_text(text):
     # Kannada Unicode range \u0C80-\u0CFF
@@ -39,86 +14,76 @@ def tokenize_kannada_text(text):
 def normalize_word(w):
     return w.strip()
 
-def main(target=5000, outpath="../dictionaries/root_words.csv"):
+def is_root_candidate(tok):
+    # skip too short words or numeric content
+    return len(tok) >= 2 and not any(ch.isdigit() for ch in tok)
 
-    seen = OrderedDict()
+FIELDNAMES = ["word", "meaning", "word_type", "last_sound", "can_combine"]
 
-    # Try to load seed file
-    try:
-        with open("../dictionaries/root_words_seed.csv", "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for r in reader:
-                w = normalize_word(r["word"])
-                seen[w] = r
-    except FileNotFoundError:
-        pass
-
-    pbar = tqdm(total=target, desc="Collecting words")
-    pbar.update(len(seen))
-
-    # Start scraping random pages
-    while len(seen) < target:
-        try:
-            titles = get_random_pages(30)
-        except Exception as e:
-            print("API error:", e)
-            time.sleep(3)
-            continue
-
-        for t in titles:
-            text = get_page_text(t)
-            tokens = tokenize_kannada_text(text)
-
-            for tok in tokens:
-                tok = normalize_word(tok)
-
-                # skip too short words or numeric content
-                if len(tok) < 2 or any(ch.isdigit() for ch in tok):
-                    continue
-
-                if tok not in seen:
-                    seen[tok] = {
-                        "word": tok,
-                        "meaning": "",
-                        "word_type": "",
-                        "last_sound": tok[-1],
-                        "can_combine": "yes"
-                    }
-                    pbar.update(1)
+def output_row(w, row):
+    return {
+        "word": row.get("word", w),
+        "meaning": row.get("meaning", ""),
+        "word_type": row.get("word_type", ""),
+        "last_sound": row.get("last_sound", w[-1] if w else ""),
+        "can_combine": row.get("can_combine", "yes")
+    }
+
+def main(target=5000, outpath="../dictionaries/root_words.csv", api=API, workers=8, rate=10.0,
+         resume=False, flush_every=100, overwrite=False):
+
+    # Words are appended to outpath as they are found (flushed every
+    # flush_every rows); with resume, words already there are kept
+    seen = set()
+    if resume:
+        seen.update(normalize_word(r.get("word") or "") for r in read_rows(outpath))
+        seen.discard("")
 
+    with CsvAppender(outpath, FIELDNAMES, resume, flush_every, overwrite=overwrite) as out, \
+         ProcessedTitles(titles_log_path(outpath), resume, results=out, overwrite=overwrite) as done:
+
+        # Try to load seed file
+        try:
+            with open("../dictionaries/root_words_seed.csv", "r", encoding="utf-8") as f:
+                reader = csv.DictReader(f)
+                for r in reader:
+                    w = normalize_word(r["word"])
+                    if w and w not in seen:
+                        seen.add(w)
+                        out.writerow(output_row(w, r))
+        except FileNotFoundError:
+            pass
+
+        pbar = tqdm(total=target, desc="Collecting words")
+        pbar.update(min(len(seen), target))
+        if resume:
+            print(f"Resuming: {len(seen)} words, {len(done)} pages already processed")
+
+        # Scrape random pages; the fetcher batches, rate-limits and retries
+        with WikiFetcher(api, HEADERS, workers=workers, rate=rate) as fetcher:
+            for title, text in fetcher.iter_random_extracts(per_round=30 * workers, skip=done):
                 if len(seen) >= target:
                     break
+                tokens = tokenize_kannada_text(text)
+
+                for tok in tokens:
+                    tok = normalize_word(tok)
+
+                    if not is_root_candidate(tok):
+                        continue
 
-            if len(seen) >= target:
-                break
-
-        time.sleep(1)
-
-    pbar.close()
-
-    # ----------------------------
-    # FIXED: Ensure output folder exists
-    # ----------------------------
-    out_dir = os.path.dirname(outpath)
-    if out_dir and not os.path.exists(out_dir):
-        os.makedirs(out_dir, exist_ok=True)
-
-    # ----------------------------
-    # Write final CSV output
-    # ----------------------------
-    with open(outpath, "w", encoding="utf-8", newline="") as f:
-        fieldnames = ["word", "meaning", "word_type", "last_sound", "can_combine"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for w, row in seen.items():
-            writer.writerow({
-                "word": row.get("word", w),
-                "meaning": row.get("meaning", ""),
-                "word_type": row.get("word_type", ""),
-                "last_sound": row.get("last_sound", w[-1] if w else ""),
-                "can_combine": row.get("can_combine", "yes")
-            })
+                    if tok not in seen:
+                        seen.add(tok)
+                        out.writerow(output_row(tok, {"word": tok, "last_sound": tok[-1]}))
+                        pbar.update(1)
+
+                    if len(seen) >= target:
+                        break
+                else:
+                    # only pages read to the end count as processed
+                    done.add(title)
+
+        pbar.close()
 
     print(f"\n✔ Successfully wrote {len(seen)} words to {outpath}")
 
@@ -126,5 +91,16 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--target", type=int, default=5000, help="target # of root words")
     parser.add_argument("--out", type=str, default="../dictionaries/root_words.csv")
+    parser.add_argument("--api", type=str, default=API, help="MediaWiki API url (e.g. a wiki_stub_server.py)")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent API requests")
+    parser.add_argument("--rate", type=float, default=10.0, help="max API requests per second (0: no limit)")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue an interrupted run: keep --out and skip pages already processed")
+    parser.add_argument("--overwrite", action="store_true", help="replace an existing non-empty --out")
+    parser.add_argument("--flush-every", type=int, default=100, help="flush output every N rows")
     args = parser.parse_args()
-    main(args.target, args.out)
+    try:
+        main(args.target, args.out, args.api, args.workers, args.rate, args.resume, args.flush_every,
+             args.overwrite)
+    except FileExistsError as e:
+        parser.error(f"{e}; pass --resume to continue it or --overwrite to replace it")
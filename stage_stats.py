@@ -0,0 +1,49 @@
+# stage_stats.py
+# Per-stage counters for WordJoiner's multi-stage routines (the validate_compound
+# cascade and apply_sandhi's join paths): how often each stage ran, how often it
+# produced the answer, and the time spent in it.
+# record() bumps plain [calls, resolved, time_ns] lists under a single lock, and
+# snapshot() builds its result under that same lock. The snapshot is therefore a
+# consistent copy taken between records. Timing is measured by the caller and
+# happens outside the lock.
+
+import threading
+from typing import Any, Dict
+
+
+class StageStats:
+    def __init__(self):
+        self._data: Dict[str, Dict[str, list]] = {}   # op -> stage -> [calls, resolved, time_ns]
+        self._lock = threading.Lock()
+
+    def record(self, op: str, stage: str, resolved: bool, elapsed_ns: int) -> None:
+        with self._lock:
+            stages = self._data.get(op)
+            if stages is None:
+                stages = self._data[op] = {}
+            c = stages.get(stage)
+            if c is None:
+                c = stages[stage] = [0, 0, 0]
+            c[0] += 1
+            c[1] += resolved
+            c[2] += elapsed_ns
+
+    def reset(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """{op: {stage: {calls, resolved, total_ms, mean_us}}} in first-seen stage order."""
+        with self._lock:
+            return {
+                op: {
+                    stage: {
+                        "calls": calls,
+                        "resolved": resolved,
+                        "total_ms": round(ns / 1e6, 3),
+                        "mean_us": round(ns / calls / 1e3, 2) if calls else 0.0,
+                    }
+                    for stage, (calls, resolved, ns) in stages.items()
+                }
+                for op, stages in self._data.items()
+            }
@@ -0,0 +1,51 @@
+# suffix_trie.py
+# Reversed-suffix trie: finds every stored suffix of a word in O(len(suffix)).
+# Entries are tagged with a source name so one compiled trie can serve several
+# suffix tables (WordJoiner's vibhakti groups, the vibhakti CSV outputs and
+# vibhakti_analyzer's suffix list).
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_PAYLOAD = ""   # payload key inside a node dict (never a real character)
+
+
+class SuffixTrie:
+    def __init__(self):
+        self._root: Dict[str, Any] = {}
+
+    def add(self, suffix: str, source: str, value: Any) -> None:
+        """Register `suffix` under `source`; a suffix may carry several values."""
+        if not suffix:
+            return
+        node = self._root
+        for ch in reversed(suffix):
+            node = node.setdefault(ch, {})
+        node.setdefault(_PAYLOAD, {}).setdefault(source, []).append(value)
+
+    def iter_matches(self, word: str, source: str) -> Iterator[Tuple[str, List[Any]]]:
+        """Yield (suffix, values) for every `source` suffix of word, shortest first."""
+        node = self._root
+        n = len(word)
+        for depth in range(1, n + 1):
+            node = node.get(word[n - depth])
+            if node is None:
+                return
+            values = node.get(_PAYLOAD, {}).get(source)
+            if values:
+                yield word[n - depth:], values
+
+    def longest(self, word: str, source: str) -> Optional[Tuple[str, List[Any]]]:
+        """Longest `source` suffix of word as (suffix, values), or None."""
+        node = self._root
+        best = None
+        i = len(word) - 1
+        while i >= 0:
+            node = node.get(word[i])
+            if node is None:
+                break
+            payload = node.get(_PAYLOAD)
+            if payload is not None and source in payload:
+                best = i
+                values = payload[source]
+            i -= 1
+        return None if best is None else (word[best:], values)
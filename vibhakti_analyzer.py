@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+from code.suffix_trie import SuffixTrie
+
 # suffix → vibhakti_id rules (longest match first)
 suffix_vibhakti = [
     ("ರನ್ನು", 2),
@@ -33,16 +35,36 @@ def reverse_transform(word, suffix):
     return base
 
 
-def analyze_word(word):
+# source tag for these rules inside a (possibly shared) SuffixTrie
+ANALYZER_SOURCE = "analyzer"
+_trie = None
+
+
+def add_analyzer_suffixes(trie):
     for suffix, vibhakti_id in suffix_vibhakti:
-        if word.endswith(suffix):
-            base = reverse_transform(word, suffix)
-            return {
-                "word": word,
-                "vibhakti_id": vibhakti_id,
-                "base": base,
-                "suffix": suffix
-            }
+        trie.add(suffix, ANALYZER_SOURCE, vibhakti_id)
+    return trie
+
+
+def _default_trie():
+    global _trie
+    if _trie is None:
+        _trie = add_analyzer_suffixes(SuffixTrie())
+    return _trie
+
+
+def analyze_word(word, trie=None):
+    # longest matching suffix; pass WordJoiner.vibhakti_suffix_trie to share its compiled trie
+    match = (trie or _default_trie()).longest(word, ANALYZER_SOURCE)
+    if match:
+        suffix, ids = match
+        base = reverse_transform(word, suffix)
+        return {
+            "word": word,
+            "vibhakti_id": ids[0],
+            "base": base,
+            "suffix": suffix
+        }
     
     # Default → direct
     return {
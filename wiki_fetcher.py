@@ -0,0 +1,232 @@
+# wiki_fetcher.py
+# Concurrent MediaWiki client shared by scrape_wikipedia_roots.py and
+# extract_compounds_from_wiki.py. One pooled requests.Session is used by a
+# thread pool; titles are sent to the extracts API in batches, every request
+# goes through a shared rate limiter, and failed requests are retried with
+# exponential backoff.
+#
+# TextExtracts returns only one full-page extract per response (more pages are
+# handed out through `continue`), so batches only save round trips with
+# intro_only=True; concurrency helps in both modes.
+#
+# Offline throughput check against the stub server (wiki_stub_server.py):
+#   python wiki_stub_server.py --port 8766 --delay-ms 20 &
+#   python wiki_fetcher.py --api http://127.0.0.1:8766/w/api.php --pages 1000 --workers 8 --rate 0
+
+import argparse, json, random, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Container, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+API = "https://kn.wikipedia.org/w/api.php"
+HEADERS = {"User-Agent": "WordBuilderBot/1.0 (contact: you@example.com)"}
+
+MAX_TITLES = 20                      # exlimit cap for one extracts call
+RETRY_STATUS = {429, 500, 502, 503, 504}
+RETRY_API_ERRORS = {"maxlag", "ratelimited", "readonly"}
+
+
+class _Retryable(Exception):
+    pass
+
+
+class RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across all threads (rate <= 0: no limit)."""
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class WikiFetcher:
+    def __init__(self, api: str = API, headers: Optional[Dict[str, str]] = None, workers: int = 8,
+                 rate: float = 10.0, batch_size: int = MAX_TITLES, max_retries: int = 4,
+                 backoff: float = 0.5, timeout: float = 20.0, intro_only: bool = False,
+                 record_path: Optional[str] = None):
+        self.api = api
+        self.workers = max(1, workers)
+        self.batch_size = max(1, min(batch_size, MAX_TITLES))
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.intro_only = intro_only
+        self.limiter = RateLimiter(rate)
+
+        self.session = requests.Session()
+        self.session.headers.update(headers or HEADERS)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # fetched extracts, written by save_recording() in the stub's fixture format
+        self.record_path = record_path
+        self._recorded: Dict[str, str] = {}
+        self._record_lock = threading.Lock()
+
+        self.requests_made = 0
+        self.retries = 0
+        self._count_lock = threading.Lock()
+
+    def close(self):
+        self.session.close()
+        if self.record_path:
+            self.save_recording()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- transport ----------
+    def _get(self, params: Dict[str, object]) -> dict:
+        """GET the API with retries on connection errors, 429/5xx and retryable API errors."""
+        params = dict(params, format="json", formatversion=2)
+        for attempt in range(self.max_retries + 1):
+            self.limiter.wait()
+            delay = None
+            try:
+                r = self.session.get(self.api, params=params, timeout=self.timeout)
+                with self._count_lock:
+                    self.requests_made += 1
+                if r.status_code in RETRY_STATUS:
+                    retry_after = r.headers.get("Retry-After", "")
+                    delay = float(retry_after) if retry_after.isdigit() else None
+                    raise _Retryable(f"HTTP {r.status_code}")
+                r.raise_for_status()
+                data = r.json()
+            except (requests.ConnectionError, requests.Timeout, ValueError, _Retryable) as e:
+                # ValueError: truncated / non-JSON body
+                if attempt == self.max_retries:
+                    raise requests.RequestException(f"giving up after {attempt + 1} attempts: {e}")
+                with self._count_lock:
+                    self.retries += 1
+                time.sleep(delay if delay is not None
+                           else self.backoff * (2 ** attempt) * (0.5 + random.random()))
+                continue
+            err = data.get("error")
+            if not err:
+                return data
+            if err.get("code") not in RETRY_API_ERRORS or attempt == self.max_retries:
+                raise RuntimeError(f"MediaWiki API error: {err.get('code')}: {err.get('info')}")
+            with self._count_lock:
+                self.retries += 1
+            time.sleep(self.backoff * (2 ** attempt) * (0.5 + random.random()))
+        raise AssertionError("unreachable")
+
+    # ---------- API calls ----------
+    def random_titles(self, n: int = 50) -> List[str]:
+        """Up to n random main-namespace titles (one request per 500)."""
+        titles = []
+        while len(titles) < n:
+            data = self._get({"action": "query", "list": "random", "rnnamespace": 0,
+                              "rnlimit": min(500, n - len(titles))})
+            got = [p["title"] for p in data.get("query", {}).get("random", [])]
+            if not got:
+                break
+            titles.extend(got)
+        return titles
+
+    def extracts_batch(self, titles: List[str]) -> List[Tuple[str, str]]:
+        """Plain-text extracts for one batch of titles, following `continue`."""
+        params = {"action": "query", "prop": "extracts", "explaintext": 1, "exlimit": "max",
+                  "titles": "|".join(titles)}
+        if self.intro_only:
+            params["exintro"] = 1
+        texts: Dict[str, str] = {}
+        cont: Dict[str, object] = {}
+        while True:
+            data = self._get(dict(params, **cont))
+            for page in data.get("query", {}).get("pages", []):
+                if page.get("extract"):
+                    texts[page["title"]] = page["extract"]
+                else:
+                    texts.setdefault(page.get("title", ""), "")
+            cont = data.get("continue") or {}
+            if not cont:
+                break
+        texts.pop("", None)
+        if self.record_path:
+            with self._record_lock:
+                self._recorded.update((t, x) for t, x in texts.items() if x)
+        return list(texts.items())
+
+    def iter_extracts(self, titles: Iterable[str]) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (title, extract) for every title, fetching batches concurrently.
+        Batches complete in order; a batch that still fails after retries is skipped.
+        """
+        titles = list(titles)
+        batches = [titles[i:i + self.batch_size] for i in range(0, len(titles), self.batch_size)]
+        ex = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            for fut in [ex.submit(self.extracts_batch, b) for b in batches]:
+                try:
+                    yield from fut.result()
+                except (requests.RequestException, RuntimeError) as e:
+                    print("API error:", e)
+        finally:
+            # the caller may stop early (target reached): drop batches not yet started
+            ex.shutdown(wait=True, cancel_futures=True)
+
+    def iter_random_extracts(self, per_round: int = 100,
+                             skip: Container[str] = ()) -> Iterator[Tuple[str, str]]:
+        """
+        Endless stream of (title, extract) for random pages; the caller decides when to stop.
+        Titles in `skip` (e.g. pages finished by an earlier run) are not fetched.
+        """
+        while True:
+            try:
+                titles = [t for t in self.random_titles(per_round) if t not in skip]
+            except (requests.RequestException, RuntimeError) as e:
+                print("API error:", e)
+                time.sleep(self.backoff * 4)
+                continue
+            yield from self.iter_extracts(titles)
+
+    def save_recording(self, path: Optional[str] = None):
+        """Write the extracts seen so far as a stub fixture: {"pages": {title: extract}}."""
+        path = path or self.record_path
+        with self._record_lock:
+            pages = dict(self._recorded)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"pages": pages}, f, ensure_ascii=False, indent=1)
+
+
+def main(api=API, pages=1000, workers=8, rate=10.0, batch_size=MAX_TITLES, intro_only=False, record=None):
+    with WikiFetcher(api, workers=workers, rate=rate, batch_size=batch_size,
+                     intro_only=intro_only, record_path=record) as fetcher:
+        t0 = time.perf_counter()
+        titles = fetcher.random_titles(pages)
+        n = chars = 0
+        for _, text in fetcher.iter_extracts(titles):
+            n += 1
+            chars += len(text)
+        dt = time.perf_counter() - t0
+    print(f"{n} pages, {chars} chars in {dt:.2f}s: {n / dt:.1f} pages/s,"
+          f" {fetcher.requests_made} requests, {fetcher.retries} retries")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--api", type=str, default=API)
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=10.0, help="max requests per second (0: no limit, only for a local stub)")
+    parser.add_argument("--batch-size", type=int, default=MAX_TITLES)
+    parser.add_argument("--intro-only", action="store_true", help="fetch lead sections only (true batching)")
+    parser.add_argument("--record", type=str, default=None, help="save fetched extracts as a stub fixture")
+    args = parser.parse_args()
+    main(args.api, args.pages, args.workers, args.rate, args.batch_size, args.intro_only, args.record)
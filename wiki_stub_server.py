@@ -0,0 +1,151 @@
+# wiki_stub_server.py
+# Local stand-in for the kn.wikipedia.org API, serving recorded page extracts
+# from a fixture file so the scrapers and wiki_fetcher.py can be exercised
+# offline. Implements the two calls the scrapers make:
+#   action=query&list=random&rnlimit=N
+#   action=query&prop=extracts&explaintext=1&titles=A|B|...   (exintro optional)
+# Like TextExtracts, only one full-page extract is returned per response
+# (the rest through `continue`); with exintro up to 20 are returned.
+#
+#   python wiki_stub_server.py --port 8766 --delay-ms 20 --fail-rate 0.05
+#   python scrape_wikipedia_roots.py --api http://127.0.0.1:8766/w/api.php --out /tmp/roots.csv
+#
+# Fixtures are {"pages": {title: extract}}; wiki_fetcher.py --record writes that format.
+
+import argparse, json, os, random, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit, parse_qsl
+
+HOST = "127.0.0.1"
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "kn_wiki_pages.json")
+MAX_TITLES = 20
+
+
+def load_fixtures(path: str = DEFAULT_FIXTURES) -> Dict[str, str]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["pages"]
+
+
+class StubAPI:
+    """The API logic, independent of the HTTP layer."""
+    def __init__(self, pages: Dict[str, str], seed: Optional[int] = None):
+        self.pages = pages
+        self.titles = list(pages)
+        self.ids = {t: i + 1 for i, t in enumerate(self.titles)}
+        self.rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def random(self, q: Dict[str, str]) -> dict:
+        n = max(1, min(500, int(q.get("rnlimit", 1) or 1)))
+        with self._lock:
+            picked = self.rng.sample(self.titles, min(n, len(self.titles)))
+        return {"batchcomplete": True, "query": {"random": [{"ns": 0, "title": t} for t in picked]}}
+
+    def extracts(self, q: Dict[str, str]) -> dict:
+        titles = [t for t in q.get("titles", "").split("|") if t]
+        if len(titles) > 50:
+            return {"error": {"code": "toomanyvalues", "info": "Too many values supplied for parameter \"titles\"."}}
+        intro = q.get("exintro") not in (None, "", "0", "false")
+        limit = MAX_TITLES if intro else 1
+        start = int(q.get("excontinue", 0) or 0)
+        pages, served = [], 0
+        for i, t in enumerate(titles):
+            if t not in self.pages:
+                pages.append({"ns": 0, "title": t, "missing": True})
+                continue
+            page = {"pageid": self.ids[t], "ns": 0, "title": t}
+            if i >= start and served < limit:
+                text = self.pages[t]
+                page["extract"] = text.split("\n\n", 1)[0] if intro else text
+                served += 1
+            pages.append(page)
+        out: dict = {"query": {"pages": pages}}
+        nxt = next((i for i, t in enumerate(titles)
+                    if i >= start and t in self.pages and "extract" not in pages[i]), None)
+        if nxt is None:
+            out["batchcomplete"] = True
+        else:
+            out["continue"] = {"excontinue": nxt, "continue": "||"}
+        if q.get("formatversion") != "2":
+            out["query"]["pages"] = {str(p.get("pageid", -1 - i)): p for i, p in enumerate(pages)}
+        return out
+
+    def handle(self, q: Dict[str, str]) -> dict:
+        with self._lock:
+            self.calls += 1
+        if q.get("action") != "query":
+            return {"error": {"code": "badvalue", "info": "stub only supports action=query"}}
+        if q.get("list") == "random":
+            return self.random(q)
+        if q.get("prop") == "extracts":
+            return self.extracts(q)
+        return {"error": {"code": "badvalue", "info": "stub supports list=random and prop=extracts"}}
+
+
+def make_server(port: int = 8766, fixtures: str = DEFAULT_FIXTURES, delay_ms: float = 0.0,
+                fail_rate: float = 0.0, seed: Optional[int] = None) -> ThreadingHTTPServer:
+    """Build (not start) a stub server; port 0 picks a free port (see server.server_address)."""
+    api = StubAPI(load_fixtures(fixtures), seed)
+    fail_rng = random.Random(seed)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            if url.path != "/w/api.php":
+                return self._send(404, {"error": {"code": "notfound", "info": url.path}})
+            if delay_ms:
+                time.sleep(delay_ms / 1000.0)
+            if fail_rate and fail_rng.random() < fail_rate:
+                return self._send(503, {"error": {"code": "unavailable", "info": "injected failure"}},
+                                  {"Retry-After": "0"})
+            self._send(200, api.handle(dict(parse_qsl(url.query))))
+
+        def _send(self, status: int, payload: dict, headers: Optional[Dict[str, str]] = None):
+            data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((HOST, port), Handler)
+    server.daemon_threads = True
+    server.api = api
+    return server
+
+
+def start_in_thread(**kwargs) -> Tuple[ThreadingHTTPServer, str]:
+    """Start a stub on a background thread; returns (server, api_url). Stop with server.shutdown()."""
+    server = make_server(**dict({"port": 0}, **kwargs))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}/w/api.php"
+
+
+def main(port=8766, fixtures=DEFAULT_FIXTURES, delay_ms=0.0, fail_rate=0.0, seed=None):
+    server = make_server(port, fixtures, delay_ms, fail_rate, seed)
+    print(f"Stub MediaWiki API on http://{HOST}:{port}/w/api.php ({len(server.api.pages)} pages)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--fixtures", type=str, default=DEFAULT_FIXTURES)
+    parser.add_argument("--delay-ms", type=float, default=0.0, help="simulated per-request latency")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    main(args.port, args.fixtures, args.delay_ms, args.fail_rate, args.seed)
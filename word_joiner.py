@@ -2,71 +2,363 @@
 # Heavy WordJoiner: sandhi, reverse-sandhi, vibhakti (single input), samasa (dictionary + fuzzy), transliteration.
 # Works with optional CSVs in "../dictionaries/"
 
-from typing import Optional, Tuple, List, Dict
-import os, csv, difflib, re
-from code.fuzzy_utils import fuzzy_matches, best_match, norm_str
+from typing import Optional, Tuple, List, Dict, NamedTuple, Iterable, Iterator
+import os, csv, difflib, re, functools, inspect, pickle, contextlib, time
+from code.fuzzy_utils import fuzzy_matches, best_match, norm_str, FuzzyIndex
+from code.prefix_trie import PrefixTrie
+from code.completion_index import CompletionIndex
+from code.lru_cache import LRUCache
+from code.stage_stats import StageStats
+from code.dict_snapshot import load_snapshot, save_snapshot
+from code.suffix_trie import SuffixTrie
+from code.akshara import split_points
+from code import vibhakti_analyzer
 
 
 # Kannada character sets
 INDEPENDENT_VOWELS = set("ಅಆಇಈಉಊಋಎಏಐಒಓಔ")
 DEPENDENT_VOWELS = set("ಾಿೀುೂೃೆೇೈೊೋೌ")
 VIRAMA = "್"
+# independent vowel -> its dependent sign (ಅ is the inherent vowel, no sign)
+VOWEL_SIGNS = {
+    "ಅ": "", "ಆ": "ಾ", "ಇ": "ಿ", "ಈ": "ೀ", "ಉ": "ು", "ಊ": "ೂ", "ಋ": "ೃ",
+    "ಎ": "ೆ", "ಏ": "ೇ", "ಐ": "ೈ", "ಒ": "ೊ", "ಓ": "ೋ", "ಔ": "ೌ",
+}
 
 def _data_path(filename: str) -> str:
     base = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
     return os.path.join(base, "dictionaries", filename)
 
+def _resolve_path(path: str) -> str:
+    return path if os.path.isabs(path) else _data_path(os.path.basename(path))
+
 def _is_kannada_char(ch: str) -> bool:
     return '\u0c80' <= ch <= '\u0cff'
 
 def _is_kannada(s: str) -> bool:
     return any(_is_kannada_char(ch) for ch in (s or ""))
 
+DEFAULT_SNAPSHOT = "dictionaries/word_joiner.snapshot"
+
+# lazily loaded resources: group -> (loader method, attributes it sets).
+# Touching any of these attributes loads its group on first use; the
+# binary snapshot stores one pickled blob per group.
+_RESOURCE_GROUPS = {
+    "sandhi": ("_init_sandhi", ("sandhi_rules_csv", "sandhi_table", "_sandhi_index")),
+    "vibhakti": ("_init_vibhakti", ("vibhakti_rules_csv", "vibhakti_table",
+                                    "vibhakti_suffix_trie", "_suffix_pool", "_suffix_fuzzy")),
+    "compounds": ("_init_compounds", ("compound_rows", "compound_map", "_compound_list")),
+    "roots": ("_init_roots", ("root_set", "_root_list", "root_trie")),
+    "fuzzy": ("_build_fuzzy_indexes", ("_root_fuzzy", "_compound_fuzzy", "_vibhakti_fuzzy", "_suggestion_fuzzy")),
+    "completion": ("_build_completion_index", ("_completion_index",)),
+}
+# compound_words.csv frequency -> completion score weight
+_FREQ_WEIGHT = {"high": 3, "medium": 2, "low": 1}
+
+_ATTR_GROUP = {attr: group for group, (_, attrs) in _RESOURCE_GROUPS.items() for attr in attrs}
+
+# per-method LRU sizes; pass cache_sizes to WordJoiner to override (0 disables)
+DEFAULT_CACHE_SIZES = {
+    "validate_compound": 4096,
+    "reverse_sandhi": 4096,
+    "detect_vibhakti": 8192,
+    "transliterate": 8192,
+}
+
+def _memoized(method):
+    """
+    Route a single-argument WordJoiner method through its LRU cache (if
+    enabled). The argument may be passed by position or by its own name.
+    """
+    name = method.__name__
+    sig = inspect.signature(method)
+    param = list(sig.parameters)[1]
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if len(args) == 1 and not kwargs:
+            arg = args[0]
+        else:
+            arg = sig.bind(self, *args, **kwargs).arguments[param]
+        return self._cached(name, arg, method, self, arg)
+    return wrapper
+
+
+# ---------- compiled sandhi rules ----------
+class SandhiRule(NamedTuple):
+    """A sandhi table row with its cells stripped and flags parsed once."""
+    rule_number: str
+    sound1: str
+    sound2: str
+    result: str
+    combined_result: str
+    example_word1: str
+    example_word2: str
+    delete_first: bool
+    row: Dict[str, str]
+
+    @classmethod
+    def from_row(cls, r: Dict[str, str]) -> "SandhiRule":
+        return cls(
+            rule_number=(r.get("rule_number") or "").strip(),
+            sound1=r.get("sound1") or "",
+            sound2=r.get("sound2") or "",
+            result=(r.get("result") or "").strip(),
+            combined_result=(r.get("combined_result") or "").strip(),
+            example_word1=(r.get("example_word1") or "").strip(),
+            example_word2=(r.get("example_word2") or "").strip(),
+            delete_first=str(r.get("delete_first_of_w2") or "").strip().lower() == "yes",
+            row=r,
+        )
+
+
+class SandhiJunction(NamedTuple):
+    """
+    One way two parts can meet inside a joined word, read backwards:
+    `consumed` is the text apply_sandhi put at the boundary, `left_restores`
+    are the endings it may have dropped from the left part, and
+    `right_prefix` is the initial sound it deleted from the right part.
+    """
+    consumed: str
+    left_restores: Tuple[str, ...]
+    right_prefix: str
+    cost: float
+
+
+class SandhiRuleIndex:
+    """
+    Hash index over the sandhi rules so a boundary lookup is O(1).
+    `exact` and `by_sound2` keep the first matching row of the merged table
+    (same precedence as a linear scan); `csv_exact` keeps the first CSV row
+    per (sound1, sound2) that actually produces output.
+    """
+    def __init__(self, table: List[Dict[str,str]], csv_rows: List[Dict[str,str]]):
+        self.exact: Dict[Tuple[str,str], SandhiRule] = {}
+        self.by_sound2: Dict[str, SandhiRule] = {}
+        self.csv_exact: Dict[Tuple[str,str], SandhiRule] = {}
+        # rules with a combined_result and both examples, in table order
+        self.prefix_examples: List[SandhiRule] = []
+        # reverse junctions keyed by the first character they consume ("" = plain join)
+        self.junctions: Dict[str, List[SandhiJunction]] = {}
+
+        for r in table:
+            rule = SandhiRule.from_row(r)
+            self.exact.setdefault((rule.sound1, rule.sound2), rule)
+            self.by_sound2.setdefault(rule.sound2, rule)
+            if rule.combined_result and rule.example_word1 and rule.example_word2:
+                self.prefix_examples.append(rule)
+
+        for r in csv_rows:
+            rule = SandhiRule.from_row(r)
+            if rule.combined_result or rule.result:
+                self.csv_exact.setdefault((rule.sound1, rule.sound2), rule)
+
+        self._compile_junctions(table)
+
+    def _compile_junctions(self, table: List[Dict[str,str]]):
+        # apply_sandhi drops any trailing vowel sign before `result` (the
+        # sound2-only fallback fires whatever the left vowel was), so every
+        # sign is a possible restore; the rule's own sound1 sign goes first
+        signs = tuple(sorted(DEPENDENT_VOWELS))
+        found = [SandhiJunction("", ("",), "", 0.0)]
+        for r in table:
+            rule = SandhiRule.from_row(r)
+            right = rule.sound2 if rule.delete_first else ""
+            if rule.combined_result:
+                found.append(SandhiJunction(rule.combined_result, ("",), right, 0.0))
+            elif rule.result:
+                own = VOWEL_SIGNS.get(rule.sound1, rule.sound1 if rule.sound1 in DEPENDENT_VOWELS else "")
+                restores = ("",) + ((own,) if own else ()) + tuple(x for x in signs if x != own)
+                found.append(SandhiJunction(rule.result, restores, right, 0.0))
+        # apply_sandhi's explicit ಇ/ಈ rule and the ಯ/ವ insertion heuristics
+        found += [SandhiJunction("ೆ", ("",) + signs, "ಇ", 0.1), SandhiJunction("ೆ", ("",) + signs, "ಈ", 0.1),
+                  SandhiJunction("ಯ", ("",), "ಅ", 0.2), SandhiJunction("ವ", ("",), "ಅ", 0.2)]
+        seen = set()
+        for j in found:
+            key = (j.consumed, j.left_restores, j.right_prefix)
+            if key not in seen:
+                seen.add(key)
+                self.junctions.setdefault(j.consumed[:1], []).append(j)
+
+    def lookup(self, last: str, first: str) -> Optional[SandhiRule]:
+        rule = self.exact.get((last, first))
+        if rule is None:
+            rule = self.by_sound2.get(first)
+        return rule
+
+
+# ---------- compiled transliteration ----------
+# Latin -> Kannada in one left-to-right pass, longest token first. A consonant
+# carries the inherent vowel: a vowel after it becomes its sign ("ka" -> ಕ,
+# "kaa" -> ಕಾ), a consonant after it is joined with a virama ("kr" -> ಕ್ರ), and
+# anything else (end of word, space, digit) closes it with a virama.
+TRANSLIT_CONSONANTS = {
+    "ksh": "ಕ್ಷ", "chh": "ಛ",
+    "kh": "ಖ", "gh": "ಘ", "ch": "ಚ", "jh": "ಝ", "th": "ಥ", "dh": "ಧ",
+    "ph": "ಫ", "bh": "ಭ", "sh": "ಶ",
+    "k": "ಕ", "g": "ಗ", "c": "ಚ", "j": "ಜ", "t": "ಟ", "d": "ಡ", "n": "ನ",
+    "p": "ಪ", "b": "ಬ", "m": "ಮ", "y": "ಯ", "r": "ರ", "l": "ಲ", "v": "ವ",
+    "w": "ವ", "s": "ಸ", "h": "ಹ", "f": "ಫ", "z": "ಜ", "q": "ಕ", "x": "ಕ್ಸ",
+}
+# latin -> (independent vowel, dependent sign)
+TRANSLIT_VOWELS = {
+    "aa": ("ಆ", "ಾ"), "ii": ("ಈ", "ೀ"), "ee": ("ಈ", "ೀ"), "uu": ("ಊ", "ೂ"),
+    "oo": ("ಓ", "ೋ"), "ai": ("ಐ", "ೈ"), "au": ("ಔ", "ೌ"),
+    "a": ("ಅ", ""), "i": ("ಇ", "ಿ"), "u": ("ಉ", "ು"), "e": ("ಎ", "ೆ"), "o": ("ಒ", "ೊ"),
+}
+# token -> (text when it starts a syllable, text right after a bare consonant,
+# whether it leaves a bare consonant behind); unknown characters pass through
+_TRANSLIT_TABLE = {lat: (kan, VIRAMA + kan, True) for lat, kan in TRANSLIT_CONSONANTS.items()}
+_TRANSLIT_TABLE.update((lat, (ind, sign, False)) for lat, (ind, sign) in TRANSLIT_VOWELS.items())
+_TRANSLIT_RE = re.compile("|".join(re.escape(t) for t in sorted(_TRANSLIT_TABLE, key=len, reverse=True)) + "|.", re.S)
+
+
+def transliterate_latin(s: str) -> str:
+    """Transliterate lowercase romanized text (see TRANSLIT_CONSONANTS / TRANSLIT_VOWELS)."""
+    out = []
+    bare = False   # last token was a consonant still waiting for its vowel
+    table = _TRANSLIT_TABLE
+    for tok in _TRANSLIT_RE.findall(s):
+        entry = table.get(tok)
+        if entry is None:
+            out.append(VIRAMA + tok if bare else tok)
+            bare = False
+        else:
+            out.append(entry[1] if bare else entry[0])
+            bare = entry[2]
+    if bare:
+        out.append(VIRAMA)
+    return "".join(out)
+
+
 class WordJoiner:
     def __init__(self,
                  sandhi_csv: str = "dictionaries/sandhi_rules.csv",
                  vibhakti_csv: str = "dictionaries/vibhakti_rules.csv",
                  compound_csv: str = "dictionaries/compound_words.csv",
-                 root_csv: str = "dictionaries/root_words.csv"):
+                 root_csv: str = "dictionaries/root_words.csv",
+                 cache_sizes: Optional[Dict[str,int]] = None,
+                 snapshot_path: Optional[str] = DEFAULT_SNAPSHOT):
 
         # CSV path resolution (safe)
-        self.sandhi_csv = sandhi_csv if os.path.isabs(sandhi_csv) else _data_path(os.path.basename(sandhi_csv))
-        self.vibhakti_csv = vibhakti_csv if os.path.isabs(vibhakti_csv) else _data_path(os.path.basename(vibhakti_csv))
-        self.compound_csv = compound_csv if os.path.isabs(compound_csv) else _data_path(os.path.basename(compound_csv))
-        self.root_csv = root_csv if os.path.isabs(root_csv) else _data_path(os.path.basename(root_csv))
+        self.sandhi_csv = _resolve_path(sandhi_csv)
+        self.vibhakti_csv = _resolve_path(vibhakti_csv)
+        self.compound_csv = _resolve_path(compound_csv)
+        self.root_csv = _resolve_path(root_csv)
+        self.snapshot_path = _resolve_path(snapshot_path) if snapshot_path else None
 
-        # load if present
-        self.sandhi_rules_csv = self._load_csv_dict(self.sandhi_csv)
-        self.vibhakti_rules_csv = self._load_csv_dict(self.vibhakti_csv)
-        self.compound_rows = self._load_csv_dict(self.compound_csv)
-        self.root_set = self._load_roots(self.root_csv)
+        # Resources load on first use (see _RESOURCE_GROUPS). Prefer the
+        # precompiled snapshot; when a CSV changed it is ignored and rewritten
+        # once every group has been rebuilt from the CSVs.
+        self._snapshot_groups = load_snapshot(self.snapshot_path, self._source_paths()) if self.snapshot_path else None
+        self._loaded_groups = set()
+
+        self.configure_cache(cache_sizes)
+        self._stage_stats: Optional[StageStats] = None   # see enable_stage_stats()
+
+        # typical vibhakti suffix groups for detection (longest-first usage)
+        self.vibhakti_suffixes = {
+            "2": ["ವನ್ನು","ಅನ್ನು","ನ್ನು"],
+            "3": ["ಯಿಂದ","ಇಂದ","ರಿಂದ"],
+            "4": ["ಕ್ಕೆ","ಗೆ"],
+            "6": ["ನ","ಅದ","ಆದ"],
+            "7": ["ನಲ್ಲಿ","ಅಲ್ಲಿ","ಲ್ಲಿ"]
+        }
+
+    # ---------- lazy resources ----------
+    def __getattr__(self, name):
+        # only called for attributes not set yet: load the owning resource group
+        group = _ATTR_GROUP.get(name)
+        if group is None or "_loaded_groups" not in self.__dict__:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        self._load_group(group)
+        return self.__dict__[name]
+
+    def _load_group(self, group: str, autosave: bool = True):
+        if group in self._loaded_groups:
+            return
+        blobs = self._snapshot_groups
+        if blobs and group in blobs:
+            self.__dict__.update(pickle.loads(blobs.pop(group)))
+            self._loaded_groups.add(group)
+            return
+        getattr(self, _RESOURCE_GROUPS[group][0])()
+        self._loaded_groups.add(group)
+        if autosave and self.snapshot_path and len(self._loaded_groups) == len(_RESOURCE_GROUPS):
+            self.save_snapshot()
 
-        # sandhi & vibhakti tables (built-in minimal set; CSVs can override)
+    def preload(self):
+        """Load every resource now (for servers that want everything warm)."""
+        for group in _RESOURCE_GROUPS:
+            self._load_group(group)
+        return self
+
+    def _init_sandhi(self):
+        # sandhi table (built-in minimal set; CSV can override)
+        self.sandhi_rules_csv = self._load_csv_dict(self.sandhi_csv)
         self.sandhi_table = self._build_default_sandhi_table()
         if self.sandhi_rules_csv:
             self._merge_sandhi_csv(self.sandhi_rules_csv)
+        self._compile_sandhi_index()
 
+    def _init_vibhakti(self):
+        self.vibhakti_rules_csv = self._load_csv_dict(self.vibhakti_csv)
         self.vibhakti_table = self._build_default_vibhakti_table()
         if self.vibhakti_rules_csv:
             self._merge_vibhakti_csv(self.vibhakti_rules_csv)
+        self._build_suffix_index()
+
+    def _build_suffix_index(self):
+        """
+        (Re)build the shared reversed-suffix trie; call after editing
+        vibhakti_table or vibhakti_suffixes. Sources: "table" (last 6 chars of
+        each table output -> row index), "suffix" (vibhakti_suffixes -> id)
+        and vibhakti_analyzer's suffix list.
+        """
+        trie = SuffixTrie()
+        for idx, r in enumerate(self.vibhakti_table):
+            out = (r.get("output") or "").strip()
+            if out:
+                trie.add(out[-6:], "table", idx)
+        pool = []
+        for vid, s_list in self.vibhakti_suffixes.items():
+            for s in s_list:
+                if s:
+                    trie.add(s, "suffix", vid)
+                    pool.append((vid, s))
+        vibhakti_analyzer.add_analyzer_suffixes(trie)
+        self.vibhakti_suffix_trie = trie
+        self._suffix_pool = pool
+        self._suffix_fuzzy = FuzzyIndex([s for _, s in pool])
 
+    def _init_compounds(self):
         # compound dict for exact mapping
+        self.compound_rows = self._load_csv_dict(self.compound_csv)
         self.compound_map = {}
         for r in self.compound_rows:
             key = (r.get("combined") or "").strip()
             if key:
                 self.compound_map[key] = r
         self._compound_list = list(self.compound_map.keys())
+
+    def _init_roots(self):
+        self.root_set = self._load_roots(self.root_csv)
         self._root_list = sorted(list(self.root_set))
+        self._build_root_index()
 
-        # typical vibhakti suffix groups for detection (longest-first usage)
-        self.vibhakti_suffixes = {
-            "2": ["ವನ್ನು","ಅನ್ನು","ನ್ನು"],
-            "3": ["ಯಿಂದ","ಇಂದ","ರಿಂದ"],
-            "4": ["ಕ್ಕೆ","ಗೆ"],
-            "6": ["ನ","ಅದ","ಆದ"],
-            "7": ["ನಲ್ಲಿ","ಅಲ್ಲಿ","ಲ್ಲಿ"]
+    # ---------- binary snapshot ----------
+    def _source_paths(self) -> List[str]:
+        return [self.sandhi_csv, self.vibhakti_csv, self.compound_csv, self.root_csv]
+
+    def save_snapshot(self, path: Optional[str] = None) -> bool:
+        """Write dictionaries + derived indexes to a snapshot (default: self.snapshot_path)."""
+        path = path or self.snapshot_path or _resolve_path(DEFAULT_SNAPSHOT)
+        for group in _RESOURCE_GROUPS:
+            self._load_group(group, autosave=False)
+        state = {
+            group: pickle.dumps({name: self.__dict__[name] for name in attrs}, protocol=pickle.HIGHEST_PROTOCOL)
+            for group, (_, attrs) in _RESOURCE_GROUPS.items()
         }
+        return save_snapshot(path, state, self._source_paths())
 
     # ---------- CSV helpers ----------
     def _load_csv_dict(self, path: str) -> List[Dict[str,str]]:
@@ -96,6 +388,113 @@ class WordJoiner:
             s=set()
         return s
 
+    def _build_root_index(self):
+        """(Re)build the root trie; call after editing root_set."""
+        self.root_trie = PrefixTrie(self.root_set)
+
+    def _build_fuzzy_indexes(self):
+        """(Re)build the fuzzy pools; call after editing roots, compounds or the vibhakti table."""
+        self._root_fuzzy = FuzzyIndex(self._root_list)
+        self._compound_fuzzy = FuzzyIndex(self._compound_list)
+        bases = [r.get("base") for r in self.vibhakti_table if r.get("base")]
+        self._vibhakti_fuzzy = FuzzyIndex(bases + self._root_list)
+        self._suggestion_fuzzy = FuzzyIndex(dict.fromkeys(self._compound_list + self._root_list))
+
+    def _build_completion_index(self):
+        """
+        (Re)build the prefix-completion index; call after editing roots or compounds.
+        A compound scores its frequency weight, a root the summed weights of the
+        compounds it takes part in (plus 1, so unused roots still complete).
+        """
+        scores: Dict[str, int] = {w: 1 for w in self.root_set}
+        for combined, r in self.compound_map.items():
+            weight = _FREQ_WEIGHT.get((r.get("frequency") or "").strip().lower(), 1)
+            scores[combined] = max(scores.get(combined, 0), weight)
+            for part in (r.get("word1"), r.get("word2")):
+                part = (part or "").strip()
+                if part in self.root_set:
+                    scores[part] += weight
+        self._completion_index = CompletionIndex(scores)
+
+    # ---------- memoization ----------
+    def configure_cache(self, cache_sizes: Optional[Dict[str,int]] = None):
+        """
+        Set per-method LRU sizes (missing names use DEFAULT_CACHE_SIZES, 0 disables).
+        Existing entries and counters are dropped.
+        """
+        sizes = dict(DEFAULT_CACHE_SIZES)
+        sizes.update(cache_sizes or {})
+        self._caches: Dict[str, LRUCache] = {
+            name: LRUCache(size) for name, size in sizes.items()
+            if name in DEFAULT_CACHE_SIZES and size and size > 0
+        }
+
+    def clear_cache(self, method: Optional[str] = None):
+        """Drop cached results for one method, or for all when method is None."""
+        for name, cache in self._caches.items():
+            if method is None or name == method:
+                cache.clear()
+
+    def _cached(self, name: str, key, compute, *args):
+        """compute(*args) through the `name` LRU cache (shared by the single and *_many APIs)."""
+        cache = self._caches.get(name)
+        if cache is None:
+            return compute(*args)
+        found, value = cache.get(key)
+        if not found:
+            value = compute(*args)
+            cache.put(key, value)
+        # hand out copies of list results so callers cannot corrupt the cache
+        return list(value) if isinstance(value, list) else value
+
+    def cache_stats(self) -> Dict[str, Dict[str,int]]:
+        return {name: cache.stats() for name, cache in self._caches.items()}
+
+    # ---------- stage instrumentation ----------
+    def enable_stage_stats(self, enabled: bool = True):
+        """
+        Start (or stop) recording per-stage counts and timings for the
+        validate_compound cascade and apply_sandhi's join paths. Off by default;
+        when off the only cost is one attribute check per call. Calls answered
+        from the method LRU caches never reach the stages (see cache_stats()).
+        """
+        if not enabled:
+            self._stage_stats = None
+        elif self._stage_stats is None:
+            self._stage_stats = StageStats()
+
+    def stage_stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Counters recorded so far ({} when instrumentation is off)."""
+        return self._stage_stats.snapshot() if self._stage_stats else {}
+
+    def reset_stage_stats(self):
+        if self._stage_stats:
+            self._stage_stats.reset()
+
+    @contextlib.contextmanager
+    def instrumented(self):
+        """Enable stage stats for a block; yields the live StageStats."""
+        previous = self._stage_stats
+        self._stage_stats = previous or StageStats()
+        try:
+            yield self._stage_stats
+        finally:
+            self._stage_stats = previous
+
+    def refresh_indexes(self):
+        """
+        Rebuild every derived index from the current tables and invalidate caches.
+        Call after editing sandhi_table, vibhakti_table, compound_map or root_set.
+        """
+        self._compile_sandhi_index()
+        self._compound_list = list(self.compound_map.keys())
+        self._root_list = sorted(list(self.root_set))
+        self._build_root_index()
+        self._build_suffix_index()
+        self._build_fuzzy_indexes()
+        self._build_completion_index()
+        self.clear_cache()
+
     # --------- default sandhi table (representative rules) ----------
     def _build_default_sandhi_table(self) -> List[Dict[str,str]]:
         T=[]
@@ -130,6 +529,10 @@ class WordJoiner:
             else:
                 self.sandhi_table.append({k:str(v).strip() for k,v in r.items()})
 
+    def _compile_sandhi_index(self):
+        """(Re)build the sandhi lookup index; call after editing the sandhi tables."""
+        self._sandhi_index = SandhiRuleIndex(self.sandhi_table, self.sandhi_rules_csv)
+
     # ---------- default vibhakti ----------
     def _build_default_vibhakti_table(self) -> List[Dict[str,str]]:
         return [
@@ -169,12 +572,16 @@ class WordJoiner:
 
     # ---------- sandhi apply ----------
     def find_sandhi_rule(self, last: str, first: str) -> Optional[Dict[str,str]]:
-        for r in self.sandhi_table:
-            if r.get("sound1")==last and r.get("sound2")==first:
-                return r
-        for r in self.sandhi_table:
-            if r.get("sound2")==first:
-                return r
+        rule = self._sandhi_index.lookup(last, first)
+        return rule.row if rule else None
+
+    def _join_with_rule(self, rule: SandhiRule, w1: str, w2: str, last: str) -> Optional[str]:
+        rest = w2[1:] if rule.delete_first and len(w2) > 0 else w2
+        if rule.combined_result:
+            return w1 + rule.combined_result + rest
+        if rule.result:
+            w1_base = w1[:-1] if last in DEPENDENT_VOWELS and len(w1) >= 1 else w1
+            return w1_base + rule.result + rest
         return None
 
         # ---------------- apply_sandhi (UPDATED) ----------------
@@ -183,10 +590,25 @@ class WordJoiner:
         Improved sandhi with extra rules for vowel+vowel like ಇ/ಈ cases,
         and conservative fallbacks. Returns the combined word (Kannada).
         """
+        st = self._stage_stats
+        t0 = time.perf_counter_ns() if st else 0
+        w1, w2 = self._prepare_sandhi_pair(w1, w2)
+        if not w1 or not w2:
+            res, kind = w1 + w2, "empty"
+        else:
+            last = self._last_char(w1)
+            first = self._first_char(w2)
+            plan = self._sandhi_plan(last, first)
+            res, kind = self._join_by_plan(plan, w1, w2, last), plan[0]
+        if st:
+            st.record("apply_sandhi", kind, True, time.perf_counter_ns() - t0)
+        return res
+
+    def _prepare_sandhi_pair(self, w1: str, w2: str) -> Tuple[str,str]:
         w1 = self._norm(w1)
         w2 = self._norm(w2)
         if not w1 or not w2:
-            return w1 + w2
+            return w1, w2
 
         # transliterate roman-ish inputs if needed (keeps previous translit logic)
         if (re.search(r'[A-Za-z]', w1) or re.search(r'[A-Za-z]', w2)) and (not _is_kannada(w1) or not _is_kannada(w2)):
@@ -194,67 +616,88 @@ class WordJoiner:
             w2t = self.transliterate(w2) if re.search(r'[A-Za-z]', w2) else w2
             if _is_kannada(w1t) and _is_kannada(w2t):
                 w1, w2 = w1t, w2t
+        return w1, w2
 
-        last = self._last_char(w1)
-        first = self._first_char(w2)
-
+    def _sandhi_plan(self, last: str, first: str) -> Tuple[str, Optional[SandhiRule]]:
+        """
+        Decide how to join across the boundary (last, first).
+        Depends only on the two boundary characters, so batch callers can reuse it.
+        """
         # --- Special explicit rule: when w2 starts with independent vowels ಇ/ಈ,
         #     insert e-sound (ೆ) between rather than naive concat.
         # Example: ರಾಮ + ಈಶ್ವರ -> ರಾಮೇಶ್ವರ
         if first in ("ಇ", "ಈ"):
-            # Conservative: insert 'ೆ' (e-matra) and drop initial vowel of w2
-            # If w1 already ends with a vowel matra, remove it first to avoid duplication.
-            if last in DEPENDENT_VOWELS:
-                base = w1[:-1]
-            else:
-                base = w1
-            # use 'ೆ' (short e) or 'ೇ' (long e) depending on previous vowel length — keep simple: 'ೆ'
-            combined = base + "ೆ" + w2[1:]
-            return combined
+            return "e_sign", None
 
-        # --- Existing CSV override rules (unchanged) ---
-        if self.sandhi_rules_csv:
-            for r in self.sandhi_rules_csv:
-                s1 = r.get("sound1", "")
-                s2 = r.get("sound2", "")
-                if s1 == last and s2 == first:
-                    comb = r.get("combined_result", "").strip()
-                    res = r.get("result", "").strip()
-                    del_first = str(r.get("delete_first_of_w2", "")).strip().lower() == "yes"
-                    if comb:
-                        return w1 + comb + (w2[1:] if del_first and len(w2) > 0 else w2)
-                    if res:
-                        if last in DEPENDENT_VOWELS and len(w1) >= 1:
-                            w1_base = w1[:-1]
-                        else:
-                            w1_base = w1
-                        return w1_base + res + (w2[1:] if del_first and len(w2) > 0 else w2)
-
-        # --- Built-in rule table (unchanged logic) ---
-        rule = self.find_sandhi_rule(last, first)
+        # --- CSV override rules ---
+        rule = self._sandhi_index.csv_exact.get((last, first))
         if rule:
-            comb = (rule.get("combined_result") or "").strip()
-            res = (rule.get("result") or "").strip()
-            del_first = str(rule.get("delete_first_of_w2") or "").strip().lower() == "yes"
-            if comb:
-                return w1 + comb + (w2[1:] if del_first and len(w2) > 0 else w2)
-            if res:
-                w1_base = w1[:-1] if last in DEPENDENT_VOWELS and len(w1) >= 1 else w1
-                return w1_base + res + (w2[1:] if del_first and len(w2) > 0 else w2)
+            return "rule", rule
+
+        # --- Built-in rule table ---
+        rule = self._sandhi_index.lookup(last, first)
+        if rule and (rule.combined_result or rule.result):
+            return "rule", rule
 
         # --- Heuristic fallbacks (keep existing) ---
         if last in ("ಇ","ಈ","ಎ","ಏ","ಐ") and first == "ಅ":
-            return w1 + "ಯ" + w2[1:]
+            return "insert_ya", None
         if last in ("ಉ","ಊ","ಒ","ಓ","ಔ") and first == "ಅ":
-            return w1 + "ವ" + w2[1:]
+            return "insert_va", None
         if last and first and last == first:
-            return w1 + w2[1:]
+            return "drop_first", None
 
         # default concat
+        return "concat", None
+
+    def _join_by_plan(self, plan: Tuple[str, Optional[SandhiRule]], w1: str, w2: str, last: str) -> str:
+        kind, rule = plan
+        if kind == "e_sign":
+            # Conservative: insert 'ೆ' (e-matra) and drop initial vowel of w2
+            # If w1 already ends with a vowel matra, remove it first to avoid duplication.
+            # use 'ೆ' (short e) or 'ೇ' (long e) depending on previous vowel length — keep simple: 'ೆ'
+            base = w1[:-1] if last in DEPENDENT_VOWELS else w1
+            return base + "ೆ" + w2[1:]
+        if kind == "rule":
+            return self._join_with_rule(rule, w1, w2, last)
+        if kind == "insert_ya":
+            return w1 + "ಯ" + w2[1:]
+        if kind == "insert_va":
+            return w1 + "ವ" + w2[1:]
+        if kind == "drop_first":
+            return w1 + w2[1:]
         return w1 + w2
 
+    def apply_sandhi_many(self, pairs: Iterable[Tuple[str,str]]) -> Iterator[str]:
+        """
+        Batch apply_sandhi. Yields results in input order; repeated pairs are
+        computed once and the join plan is shared per boundary (last, first).
+        """
+        done: Dict[Tuple[str,str], str] = {}
+        plans: Dict[Tuple[str,str], Tuple[str, Optional[SandhiRule]]] = {}
+        st = self._stage_stats
+        for pair in pairs:
+            key = tuple(pair)
+            res = done.get(key)
+            if res is None:
+                t0 = time.perf_counter_ns() if st else 0
+                w1, w2 = self._prepare_sandhi_pair(*key)
+                if not w1 or not w2:
+                    res, kind = w1 + w2, "empty"
+                else:
+                    last = self._last_char(w1); first = self._first_char(w2)
+                    plan = plans.get((last, first))
+                    if plan is None:
+                        plan = plans[(last, first)] = self._sandhi_plan(last, first)
+                    res, kind = self._join_by_plan(plan, w1, w2, last), plan[0]
+                done[key] = res
+                if st:
+                    st.record("apply_sandhi", kind, True, time.perf_counter_ns() - t0)
+            yield res
+
 
     # ---------------- reverse_sandhi (UPDATED formatting-friendly) ----------------
+    @_memoized
     def reverse_sandhi(self, combined: str) -> List[Tuple[str,str]]:
         """
         Return ordered list of candidate splits (w1, w2).
@@ -266,14 +709,9 @@ class WordJoiner:
         candidates = []
 
         # 1) exact combined_result -> example splits
-        if self.sandhi_table:
-            for r in self.sandhi_table:
-                comb = (r.get("combined_result") or "").strip()
-                if comb and w.startswith(comb):
-                    ex1 = (r.get("example_word1") or "").strip()
-                    ex2 = (r.get("example_word2") or "").strip()
-                    if ex1 and ex2:
-                        candidates.append((ex1, ex2))
+        for r in self._sandhi_index.prefix_examples:
+            if w.startswith(r.combined_result):
+                candidates.append((r.example_word1, r.example_word2))
 
         # 2) inserted char heuristics (ಯ/ವ)
         for ch in ("ಯ","ವ"):
@@ -284,21 +722,20 @@ class WordJoiner:
                 if w1 and w2:
                     candidates.append((w1, w2))
 
-        # 3) brute-force splits validated by a sandhi rule
-        n = len(w)
-        for i in range(1, n):
+        # 3) splits at akshara boundaries validated by a sandhi rule
+        cuts = split_points(w)
+        for i in cuts:
             left = w[:i]; right = w[i:]
             last = self._last_char(left); first = self._first_char(right)
-            rule = self.find_sandhi_rule(last, first)
+            rule = self._sandhi_index.lookup(last, first)
             if rule:
-                del_first = str(rule.get("delete_first_of_w2") or "").strip().lower() == "yes"
-                if del_first and first:
+                if rule.delete_first and first:
                     candidates.append((left, first + right))
                 else:
                     candidates.append((left, right))
 
         # 4) vowel-boundary fallback
-        for i in range(1, n):
+        for i in cuts:
             if w[i] in INDEPENDENT_VOWELS:
                 left = w[:i]; right = w[i:]
                 if len(left) >= 2 and len(right) >= 2:
@@ -312,6 +749,66 @@ class WordJoiner:
                 seen.add(key); unique.append((a,b))
         return unique
 
+    # ---------- multi-part compound segmentation (lattice DP) ----------
+    def segment_compound(self, word: str, max_parts: int = 4, top_k: int = 5) -> List[Tuple[Tuple[str, ...], float]]:
+        """
+        Best segmentations of `word` into 1..max_parts root words, as
+        [(parts, score)] sorted best first. Boundaries are read through the
+        reverse sandhi junctions, so parts come back in their dictionary form.
+        Score = sum((len(part)/len(word))**2) - junction costs, which prefers
+        fewer, longer parts. Subproblems (position, restored prefix, parts
+        left) are memoized: O(n^2 * junctions * max_parts * top_k) overall.
+        """
+        w = self._norm(word)
+        if not w or max_parts < 1 or top_k < 1:
+            return []
+        n = len(w)
+        # a plain cut (nothing consumed) must fall on an akshara boundary; a
+        # junction may start anywhere, e.g. on the vowel sign ೆ of ರಾಮೇಶ್ವರ
+        boundaries = set(split_points(w))
+        trie = self.root_trie
+        junctions = self._sandhi_index.junctions
+        plain = junctions.get("", [])
+        memo: Dict[Tuple[int, str, int], List[Tuple[float, Tuple[str, ...]]]] = {}
+
+        def part_score(p: str) -> float:
+            return (len(p) / n) ** 2
+
+        def best(pos: int, pre: str, parts_left: int) -> List[Tuple[float, Tuple[str, ...]]]:
+            key = (pos, pre, parts_left)
+            if key in memo:
+                return memo[key]
+            found = []
+            whole = pre + w[pos:]
+            if whole in trie:
+                found.append((part_score(whole), (whole,)))
+            if parts_left > 1:
+                for j in range(pos + 1, n):
+                    core = pre + w[pos:j]
+                    if not trie.is_prefix(core):
+                        break
+                    for jn in (plain if j in boundaries else []) + junctions.get(w[j], []):
+                        nxt = j + len(jn.consumed)
+                        if nxt >= n or not w.startswith(jn.consumed, j):
+                            continue
+                        for lr in jn.left_restores:
+                            left = core + lr
+                            if left not in trie:
+                                continue
+                            for s, parts in best(nxt, jn.right_prefix, parts_left - 1):
+                                found.append((part_score(left) - jn.cost + s, (left,) + parts))
+            found.sort(key=lambda x: (-x[0], x[1]))
+            uniq, seen = [], set()
+            for s, parts in found:
+                if parts not in seen:
+                    seen.add(parts); uniq.append((s, parts))
+                    if len(uniq) == top_k:
+                        break
+            memo[key] = uniq
+            return uniq
+
+        return [(parts, round(s, 6)) for s, parts in best(0, "", max_parts)]
+
     # ---------- vibhakti (word+ending) ----------
     def apply_vibhakti(self, word: str, ending: str) -> Tuple[str, Optional[str]]:
         w = self._norm(word); e = self._norm(ending)
@@ -367,10 +864,8 @@ class WordJoiner:
                 return (r.get("output") or (w + default_ending)), r.get("vibhakti_id")
 
         # fuzzy match pool = vibhakti bases + roots
-        pool = [r.get("base") for r in self.vibhakti_table if r.get("base")] + self._root_list
-        pool = [p for p in pool if p]
-        if pool:
-            match = best_match(w, pool, cutoff=0.55)
+        if len(self._vibhakti_fuzzy):
+            match = best_match(w, self._vibhakti_fuzzy, cutoff=0.55)
             if match:
                 # if there's an exact default ending row, use it
                 for r in self.vibhakti_table:
@@ -386,89 +881,150 @@ class WordJoiner:
         return self.apply_vibhakti(w, default_ending)
 
     # ---------- detect vibhakti id and suffix (from a full Kannada word if possible) ----------
+    @_memoized
     def detect_vibhakti(self, word: str) -> Tuple[Optional[str], Optional[str]]:
-        w = self._norm(word)
+        return self._detect_vibhakti(self._norm(word), {})
+
+    def _detect_vibhakti(self, w: str, tail_memo: Dict[str, Tuple[Optional[str], Optional[str]]]) -> Tuple[Optional[str], Optional[str]]:
         if not w:
             return None, None
 
-        # check explicit vibhakti table outputs first
-        for r in self.vibhakti_table:
+        # check explicit vibhakti table outputs first (earliest matching row wins)
+        trie = self.vibhakti_suffix_trie
+        hit = None
+        for _, rows in trie.iter_matches(w, "table"):
+            for idx in rows:
+                out = (self.vibhakti_table[idx].get("output") or "").strip()
+                if (w==out or out in w) and (hit is None or idx < hit):
+                    hit = idx
+        if hit is not None:
+            r = self.vibhakti_table[hit]
             out = (r.get("output") or "").strip()
             base = (r.get("base") or "").strip()
-            if out and w.endswith(out[-6:]):
-                if w==out or out in w:
-                    suf = out[len(base):] if base and out.startswith(base) else None
-                    return r.get("vibhakti_id"), suf
+            suf = out[len(base):] if base and out.startswith(base) else None
+            return r.get("vibhakti_id"), suf
 
-        # longest-first suffix detection
-        cand=[]
-        for vid, s_list in self.vibhakti_suffixes.items():
-            for s in s_list:
-                if s and w.endswith(s):
-                    cand.append((len(s), vid, s))
-        if cand:
-            cand.sort(reverse=True)
-            _, vid, s = cand[0]
-            return vid, s
+        # longest suffix detection (ties on the same suffix -> highest id)
+        match = trie.longest(w, "suffix")
+        if match:
+            s, vids = match
+            return max(vids), s
 
         # fuzzy suffix on last up to 4 chars
         tail = w[-4:]
-        suffix_pool = []
-        for vid,s_list in self.vibhakti_suffixes.items():
-            for s in s_list:
-                if s:
-                    suffix_pool.append((vid,s))
-        pool = [s for (_,s) in suffix_pool]
-        match = best_match(tail, pool, cutoff=0.6)
+        if tail not in tail_memo:
+            tail_memo[tail] = self._fuzzy_vibhakti_suffix(tail)
+        return tail_memo[tail]
+
+    def _fuzzy_vibhakti_suffix(self, tail: str) -> Tuple[Optional[str], Optional[str]]:
+        match = best_match(tail, self._suffix_fuzzy, cutoff=0.6)
         if match:
-            for vid,s in suffix_pool:
+            for vid,s in self._suffix_pool:
                 if s==match:
                     return vid, s
         return None, None
 
+    def analyze_word(self, word: str) -> Dict[str, object]:
+        """vibhakti_analyzer.analyze_word through this joiner's compiled suffix trie."""
+        return vibhakti_analyzer.analyze_word(word, trie=self.vibhakti_suffix_trie)
+
+    def detect_vibhakti_many(self, words: Iterable[str]) -> Iterator[Tuple[Optional[str], Optional[str]]]:
+        """
+        Batch detect_vibhakti. Yields results in input order; repeated words
+        are detected once and fuzzy tail lookups are shared across the batch.
+        Results go through the same LRU cache as detect_vibhakti, so they are
+        also reused across batches.
+        """
+        done: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        tail_memo: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        detect = lambda w: self._detect_vibhakti(self._norm(w), tail_memo)
+        for word in words:
+            if word not in done:
+                done[word] = self._cached("detect_vibhakti", word, detect, word)
+            yield done[word]
+
     # ---------- validate compound (samasa) using dictionary + fuzzy fallback ----------
+    @_memoized
     def validate_compound(self, combined_word: str) -> Optional[Tuple[str,str]]:
-        w = self._norm(combined_word)
+        return self._validate_compound(self._norm(combined_word), {})
+
+    def validate_compound_many(self, words: Iterable[str]) -> Iterator[Optional[Tuple[str,str]]]:
+        """
+        Batch validate_compound. Yields results in input order; repeated words
+        are validated once and fuzzy root checks on split parts are shared.
+        Results go through the same LRU cache as validate_compound, so they
+        are also reused across batches.
+        """
+        done: Dict[str, Optional[Tuple[str,str]]] = {}
+        part_memo: Dict[str, str] = {}
+        validate = lambda w: self._validate_compound(self._norm(w), part_memo)
+        for word in words:
+            if word not in done:
+                done[word] = self._cached("validate_compound", word, validate, word)
+            yield done[word]
+
+    def _root_match(self, part: str, memo: Dict[str,str]) -> str:
+        if part not in memo:
+            memo[part] = best_match(part, self._root_fuzzy, cutoff=0.6)
+        return memo[part]
+
+    def _validate_compound(self, w: str, part_memo: Dict[str,str]) -> Optional[Tuple[str,str]]:
         if not w:
             return None
+        st = self._stage_stats
+        for name, stage in _COMPOUND_STAGES:
+            if st is None:
+                res = stage(self, w, part_memo)
+            else:
+                t0 = time.perf_counter_ns()
+                res = stage(self, w, part_memo)
+                st.record("validate_compound", name, res is not None, time.perf_counter_ns() - t0)
+            if res is not None:
+                return res
+        return None
 
-        # 1) exact compound csv
+    # 1) exact compound csv
+    def _compound_exact(self, w: str, part_memo: Dict[str,str]) -> Optional[Tuple[str,str]]:
         if w in self.compound_map:
             row = self.compound_map[w]
             b1 = row.get("base1") or row.get("part1") or row.get("example_word1") or ""
             b2 = row.get("base2") or row.get("part2") or row.get("example_word2") or ""
             if b1 and b2:
                 return b1.strip(), b2.strip()
+        return None
 
-        # 2) reverse sandhi candidates -> pick first candidate with both parts in root_set or plausible
+    # 2) reverse sandhi candidates -> pick first candidate with both parts in root_set or plausible
+    def _compound_reverse(self, w: str, part_memo: Dict[str,str]) -> Optional[Tuple[str,str]]:
         cands = self.reverse_sandhi(w)
         for a,b in cands:
             if (self._is_valid_kannada_word(a) and self._is_valid_kannada_word(b)):
                 return a,b
             # if root list exists, use fuzzy to check membership
             if self._root_list:
-                if best_match(a, self._root_list, cutoff=0.6) or best_match(b, self._root_list, cutoff=0.6):
+                if self._root_match(a, part_memo) or self._root_match(b, part_memo):
                     return a,b
+        return None
 
-        # 3) fuzzy lookup in compound map keys
-        sugg = fuzzy_matches(w, list(self.compound_map.keys()), n=1, cutoff=0.5)
+    # 3) fuzzy lookup in compound map keys
+    def _compound_fuzzy_lookup(self, w: str, part_memo: Dict[str,str]) -> Optional[Tuple[str,str]]:
+        sugg = fuzzy_matches(w, self._compound_fuzzy, n=1, cutoff=0.5)
         if sugg:
-            key = sugg[0]
+            key = sugg[0][0]
             row = self.compound_map.get(key)
             if row:
                 b1 = row.get("base1") or row.get("example_word1") or ""
                 b2 = row.get("base2") or row.get("example_word2") or ""
                 if b1 and b2:
                     return b1.strip(), b2.strip()
+        return None
 
-        # 4) vowel fallback split (last independent vowel)
-        n=len(w)
-        for i in range(1,n):
+    # 4) vowel fallback split (first independent vowel)
+    def _compound_vowel_split(self, w: str, part_memo: Dict[str,str]) -> Optional[Tuple[str,str]]:
+        for i in split_points(w):
             if w[i] in INDEPENDENT_VOWELS:
                 left=w[:i]; right=w[i:]
                 if len(left)>=2 and len(right)>=2:
                     return left, right
-
         return None
 
     def apply_compound(self, word: str) -> Optional[Tuple[str,str]]:
@@ -479,45 +1035,65 @@ class WordJoiner:
         if len(w)<2: return False
         if not _is_kannada(w): return False
         if self.root_set:
-            return w in self.root_set or any(r.startswith(w) or w.startswith(r) for r in self.root_set)
+            return self.root_trie.is_prefix(w) or self.root_trie.has_prefix_of(w)
         return True
 
+    # ---------- root lookups (trie-backed, O(len(word))) ----------
+    def is_root(self, word: str) -> bool:
+        return self._norm(word) in self.root_trie
+
+    def is_root_prefix(self, word: str) -> bool:
+        """True if the word is a prefix of (or equal to) some root."""
+        return self.root_trie.is_prefix(self._norm(word))
+
+    def longest_root_prefix(self, word: str) -> Optional[str]:
+        """Longest root that the word starts with, or None."""
+        return self.root_trie.longest_prefix_of(self._norm(word))
+
+    def has_root_prefix(self, word: str) -> bool:
+        return self.longest_root_prefix(word) is not None
+
     # ---------- suggestions ----------
     def get_suggestions(self, word: str, n:int=6) -> List[str]:
         w=self._norm(word)
         if not w: return []
-        pool = list(dict.fromkeys(self._compound_list + self._root_list))
-        if not pool: return []
-        return fuzzy_matches(w, pool, n=n, cutoff=0.5)
+        if not len(self._suggestion_fuzzy): return []
+        return [c for c, _ in fuzzy_matches(w, self._suggestion_fuzzy, n=n, cutoff=0.5)]
+
+    def complete(self, prefix: str, n: int = 8) -> List[str]:
+        """
+        Roots and compounds starting with `prefix`, most used first (compound
+        frequency), then shorter words. Cost depends on n, not the lexicon size.
+        """
+        p = self._norm(prefix)
+        if not p: return []
+        return self._completion_index.complete(p, n)
 
     # ---------- transliteration (conservative) ----------
+    @_memoized
     def transliterate(self, latin: str) -> str:
-        s=(latin or "").strip().lower()
-        if not s: return ""
-        patterns = [
-            ("sh","ಶ"),("ch","ಚ"),("kh","ಖ"),("gh","ಘ"),
-            ("th","ಥ"),("dh","ಧ"),("ph","ಫ"),("bh","ಭ"),
-            ("aa","ಾ"),("ii","ೀ"),("ee","ೀ"),("oo","ೋ"),
-            ("au","ೌ"),("ai","ೈ")
-        ]
-        out=""; i=0
-        while i < len(s):
-            matched=False
-            for pat,rep in patterns:
-                if s.startswith(pat,i):
-                    out += rep; i += len(pat); matched=True; break
-            if matched: continue
-            ch=s[i]
-            table = {
-                "a":"ಅ","i":"ಇ","u":"ಉ","e":"ಎ","o":"ಒ",
-                "k":"ಕ","g":"ಗ","j":"ಜ","t":"ಟ","d":"ಡ",
-                "n":"ನ","p":"ಪ","b":"ಬ","m":"ಮ","y":"ಯ",
-                "r":"ರ","l":"ಲ","v":"ವ","s":"ಸ","h":"ಹ","w":"ವ"
-            }
-            out += table.get(ch,ch)
-            i += 1
-        out = re.sub(r"ಅಅ+", "ಆ", out)
-        return out
+        return transliterate_latin((latin or "").strip().lower())
+
+    def transliterate_many(self, texts: Iterable[str]) -> Iterator[str]:
+        """
+        Batch transliterate. Yields results in input order; repeated inputs
+        are converted once, through the same LRU cache as transliterate.
+        """
+        done: Dict[str, str] = {}
+        convert = lambda t: transliterate_latin((t or "").strip().lower())
+        for text in texts:
+            res = done.get(text)
+            if res is None:
+                res = done[text] = self._cached("transliterate", text, convert, text)
+            yield res
+
+# validate_compound cascade, in order; stage names are the keys reported by stage_stats()
+_COMPOUND_STAGES = (
+    ("exact", WordJoiner._compound_exact),
+    ("reverse_sandhi", WordJoiner._compound_reverse),
+    ("fuzzy_compound", WordJoiner._compound_fuzzy_lookup),
+    ("vowel_fallback", WordJoiner._compound_vowel_split),
+)
 
 # quick test driver
 if __name__ == "__main__":